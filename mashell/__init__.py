@@ -1,3 +1,8 @@
 """MaShell - AI-powered command line assistant."""
 
-__version__ = "0.1.0"
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    __version__ = version("mashell")
+except PackageNotFoundError:  # Running from a source tree that isn't installed
+    __version__ = "1.0.10"
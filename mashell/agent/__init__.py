@@ -1,9 +1,25 @@
 """Agent package - core agent logic."""
 
+from typing import TYPE_CHECKING, Any
+
+from mashell.agent.cache import ResponseCache
 from mashell.agent.context import ContextManager
-from mashell.agent.core import Agent
+
+if TYPE_CHECKING:
+    from mashell.agent.core import Agent
 
 __all__ = [
     "Agent",
     "ContextManager",
+    "ResponseCache",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Agent pulls in tools and permissions; load it only when first used so
+    # importing mashell.agent.context (e.g. for sessions) stays cheap
+    if name == "Agent":
+        from mashell.agent.core import Agent
+
+        return Agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,90 @@
+"""Response cache for LLM completions."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from mashell.providers.base import Response
+
+
+class ResponseCache:
+    """
+    Exact-match cache of text-only LLM responses, persisted in SQLite.
+
+    Keys are request hashes from BaseProvider.request_key(). Responses with
+    tool calls are never cached, since replaying them would repeat side effects.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = 24 * 3600) -> None:
+        self.path = path or (Path.home() / ".mashell" / "response_cache.db")
+        self.ttl = ttl  # seconds
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()  # Slack bot and CLI may share the cache
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content TEXT, finish_reason TEXT, created REAL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Response | None:
+        """Get a cached response, or None on miss or expiry."""
+        try:
+            with self._lock:
+                cursor = self._connect().execute(
+                    "SELECT content, finish_reason FROM responses WHERE key = ? AND created > ?",
+                    (key, time.time() - self.ttl),
+                )
+                row = cursor.fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Response(content=row[0], tool_calls=None, finish_reason=row[1])
+
+    def put(self, key: str, response: Response) -> None:
+        """Cache a response if it is a pure-text completion."""
+        if response.tool_calls or not response.content:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, response.content, response.finish_reason, time.time()),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass  # Caching is best-effort
+
+    def count(self) -> int:
+        """Get the number of cached responses."""
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+        except sqlite3.Error:
+            return 0
+        return int(row[0])
+
+    def clear(self) -> int:
+        """Delete all cached responses. Returns count of deleted entries."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                count = conn.execute("DELETE FROM responses").rowcount
+                conn.commit()
+        except sqlite3.Error:
+            return 0
+        return count
@@ -4,6 +4,9 @@ from dataclasses import dataclass, field
 
 from mashell.providers.base import Message
 
+# Rough token estimate; exact counts would need a provider-specific tokenizer
+_CHARS_PER_TOKEN = 4
+
 
 @dataclass
 class TaskMemory:
@@ -56,6 +59,71 @@ class ContextManager:
 
         return result
 
+    def trim_to_budget(
+        self,
+        messages: list[Message],
+        max_tokens: int,
+        keep_recent: int = 4,
+    ) -> list[Message]:
+        """
+        Get a copy of messages that fits in an estimated token budget.
+
+        Keeps the system prompt, the last user message and the most recent
+        exchanges, dropping the oldest ones in between. An assistant message is
+        always dropped together with its tool results, so tool call pairing
+        stays valid. Dropped messages are replaced by a single user-role note.
+        """
+        total = sum(_estimate_tokens(m) for m in messages)
+        if total <= max_tokens:
+            return messages
+
+        head = messages[:1] if messages and messages[0].role == "system" else []
+
+        # Group each message with the tool results that follow it
+        groups: list[list[Message]] = []
+        for msg in messages[len(head) :]:
+            if msg.role == "tool" and groups:
+                groups[-1].append(msg)
+            else:
+                groups.append([msg])
+
+        last_user = max(
+            (i for i, group in enumerate(groups) if group[0].role == "user"), default=-1
+        )
+        protected = set(range(max(len(groups) - keep_recent, 0), len(groups))) | {last_user}
+
+        dropped: set[int] = set()
+        dropped_messages = 0
+        for i, group in enumerate(groups):
+            if total <= max_tokens:
+                break
+            if i in protected:
+                continue
+            dropped.add(i)
+            dropped_messages += len(group)
+            total -= sum(_estimate_tokens(m) for m in group)
+
+        if not dropped:
+            return messages
+
+        result = list(head)
+        noted = False
+        for i, group in enumerate(groups):
+            if i not in dropped:
+                result.extend(group)
+            elif not noted:
+                # A user message, not a system one: Anthropic takes system messages
+                # as the system prompt (a second would replace it), and several
+                # OpenAI-compatible servers reject system messages mid-conversation
+                result.append(
+                    Message(
+                        role="user",
+                        content=f"[Summary of {dropped_messages} prior messages omitted]",
+                    )
+                )
+                noted = True
+        return result
+
     def set_task(self, task: str, steps: list[str] | None = None) -> None:
         """Set the current task being worked on."""
         self.task_memory.original_task = task
@@ -136,3 +204,11 @@ class ContextManager:
         # Truncate summary if too long
         if len(self.summary) > 2000:
             self.summary = self.summary[-2000:]
+
+
+def _estimate_tokens(message: Message) -> int:
+    """Estimate the number of tokens a message uses."""
+    chars = len(message.content or "")
+    for tc in message.tool_calls or []:
+        chars += len(tc.name) + len(str(tc.arguments))
+    return chars // _CHARS_PER_TOKEN + 4  # Per-message overhead
@@ -1,22 +1,138 @@
 """Core agent implementation."""
 
+import asyncio
+import inspect
 import signal
 import threading
-from typing import Any
+import traceback
+from collections.abc import Awaitable, Callable
+from typing import Any, cast
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.markup import escape as rich_escape
 from rich.prompt import Prompt
 from rich.status import Status
+from rich.text import Text
 
+from mashell.agent.cache import ResponseCache
 from mashell.agent.context import ContextManager
-from mashell.agent.prompt import get_system_prompt
+from mashell.agent.prompt import get_system_prompt, get_system_prompt_template
 from mashell.config import Config
 from mashell.permissions import PermissionManager, PermissionRequest
 from mashell.providers import create_provider
-from mashell.providers.base import BaseProvider, Message, ToolCall
+from mashell.providers.base import BaseProvider, Message, Response, ToolCall
 from mashell.tools import create_tool_registry
-from mashell.tools.base import ToolRegistry, ToolResult
+from mashell.tools.base import BaseTool, ToolRegistry, ToolResult
+
+# Prefix for commands handled locally without calling the LLM
+HOT_COMMAND_PREFIX = "!mashell:"
+
+# Fixed output, parsed from markup once at import
+_MASHELL_PREFIX = Text.from_markup("[bold green]MaShell:[/bold green] ")
+_THOUGHT_PREFIX = Text.from_markup("[bold cyan]💭[/bold cyan] ")
+_STOPPED = Text.from_markup("[yellow]Stopped by user.[/yellow]")
+_CACHED = Text("[cached]", style="dim")
+_CACHE_OFF = Text("Response cache is off (set response_cache: true in your profile)", style="dim")
+_RUN_HDR = Text.from_markup("[bold yellow]▶ Run:[/bold yellow]")
+_OUTPUT_HDR = Text.from_markup("[bold blue]📋 Output:[/bold blue]")
+_DONE = Text.from_markup("[green]✓ Done[/green]")
+_FAILED_PREFIX = Text.from_markup("[bold red]✗ Failed:[/bold red] ")
+_CANCELLED = Text.from_markup("[yellow]⏹ Cancelled[/yellow]")
+_NEW_INSTRUCTION_PREFIX = Text.from_markup("[bold blue]📝 New instruction:[/bold blue] ")
+
+
+# Per-tool renderers: arguments -> (display command, permission description)
+def _render_shell(args: dict[str, Any]) -> tuple[str, str]:
+    cmd = str(args.get("command", ""))
+    return cmd, f"Execute shell command: {cmd}"
+
+
+def _render_run_background(args: dict[str, Any]) -> tuple[str, str]:
+    cmd = str(args.get("command", ""))
+    return cmd, f"Run in background: {cmd}"
+
+
+def _render_check_background(args: dict[str, Any]) -> tuple[str, str]:
+    task_id = args.get("task_id", "")
+    return f"check_background({task_id})", f"Check background task: {task_id}"
+
+
+def _render_read_file(args: dict[str, Any]) -> tuple[str, str]:
+    path = args.get("path", "")
+    start = args.get("start_line")
+    end = args.get("end_line")
+    if start or end:
+        return f"read_file({path!r}, lines={start or 1}-{end or 'end'})", f"Read file: {path}"
+    return f"read_file({path!r})", f"Read file: {path}"
+
+
+def _render_list_dir(args: dict[str, Any]) -> tuple[str, str]:
+    path = args.get("path", ".")
+    pattern = args.get("pattern")
+    if pattern:
+        return f"list_dir({path!r}, pattern={pattern!r})", f"List directory: {path}"
+    return f"list_dir({path!r})", f"List directory: {path}"
+
+
+def _render_search_files(args: dict[str, Any]) -> tuple[str, str]:
+    pattern = args.get("pattern", "")
+    path = args.get("path", ".")
+    return f"search_files({pattern!r}, path={path!r})", f"Search for '{pattern}' in {path}"
+
+
+def _render_write_file(args: dict[str, Any]) -> tuple[str, str]:
+    path = args.get("path", "")
+    content = args.get("content", "")
+    return f"write_file({path!r}, {len(content)} chars)", f"Write to file: {path}"
+
+
+def _render_crawl(args: dict[str, Any]) -> tuple[str, str]:
+    query = args.get("query", "")
+    return f"crawl({query!r})", f"Web search: {query}"
+
+
+def _render_fetch_page(args: dict[str, Any]) -> tuple[str, str]:
+    url = args.get("url", "")
+    return f"fetch_page({url!r})", f"Fetch page: {url}"
+
+
+def _render_edit_docx(args: dict[str, Any]) -> tuple[str, str]:
+    path = args.get("path", "")
+    ops = args.get("operations", [])
+    save_as = args.get("save_as")
+    if save_as:
+        return (
+            f"edit_docx({path!r}, {len(ops)} ops, save_as={save_as!r})",
+            f"Edit Word document: {path}",
+        )
+    return f"edit_docx({path!r}, {len(ops)} ops)", f"Edit Word document: {path}"
+
+
+_TOOL_RENDERERS: dict[str, Callable[[dict[str, Any]], tuple[str, str]]] = {
+    "shell": _render_shell,
+    "run_background": _render_run_background,
+    "check_background": _render_check_background,
+    "read_file": _render_read_file,
+    "list_dir": _render_list_dir,
+    "search_files": _render_search_files,
+    "write_file": _render_write_file,
+    "crawl": _render_crawl,
+    "fetch_page": _render_fetch_page,
+    "edit_docx": _render_edit_docx,
+}
+
+_TOOL_STATUS_MESSAGES = {
+    "shell": "Executing command...",
+    "run_background": "Starting background task...",
+    "check_background": "Checking task status...",
+    "read_file": "Reading file...",
+    "list_dir": "Listing directory...",
+    "search_files": "Searching files...",
+    "write_file": "Writing file...",
+    "crawl": "Crawling web...",
+    "fetch_page": "Fetching page...",
+    "edit_docx": "Editing Word document...",
+}
 
 
 class InterruptError(Exception):
@@ -52,11 +168,24 @@ class Agent:
         # Create context manager
         self.context = ContextManager()
 
+        # Cache of text-only LLM responses, only when enabled in the profile
+        self.response_cache = ResponseCache() if config.response_cache else None
+        self._use_cache = True
+
+        # Hot commands (e.g. "!mashell:bust") answered directly
+        self._hot_commands = {
+            "skip": self._hot_skip,
+            "bust": self._hot_bust,
+            "stats": self._hot_stats,
+            "revoke": self._hot_revoke,
+        }
+
         # Verbose mode
         self.verbose = config.verbose
 
-        # Loading spinner
-        self._spinner: Status | None = None
+        # Loading spinner, created once and restarted as needed
+        self._spinner: Status = self.console.status("", spinner="dots")
+        self._spinning = False
 
         # Interrupt flag
         self._interrupted = False
@@ -64,19 +193,14 @@ class Agent:
 
     def _start_status(self, message: str, emoji: str = "🤔") -> None:
         """Show status indicator with custom message."""
-        if self._spinner is not None:
-            self._spinner.stop()
-        self._spinner = self.console.status(
-            f"[bold cyan]{emoji} {message}[/bold cyan]", spinner="dots"
-        )
-        self._spinner.start()
+        self._spinner.update(f"[bold cyan]{emoji} {message}[/bold cyan]")
+        if not self._spinning:
+            self._spinner.start()
+            self._spinning = True
 
     def _update_status(self, message: str, emoji: str = "⚡") -> None:
         """Update the status message without stopping/starting."""
-        if self._spinner is not None:
-            self._spinner.update(f"[bold cyan]{emoji} {message}[/bold cyan]")
-        else:
-            self._start_status(message, emoji)
+        self._start_status(message, emoji)
 
     def _start_thinking(self) -> None:
         """Show thinking indicator."""
@@ -84,9 +208,9 @@ class Agent:
 
     def _stop_thinking(self) -> None:
         """Hide thinking indicator."""
-        if self._spinner is not None:
+        if self._spinning:
             self._spinner.stop()
-            self._spinner = None
+            self._spinning = False
 
     def _setup_interrupt_handler(self) -> None:
         """Setup Ctrl+C handler to allow interruption."""
@@ -137,6 +261,12 @@ class Agent:
 
     async def run(self, user_input: str) -> str | None:
         """Run the agent with user input."""
+        # Answer trivially-decidable inputs directly, without an LLM round-trip
+        stripped = user_input.strip()
+        if not stripped:
+            return None
+        if stripped.startswith(HOT_COMMAND_PREFIX):
+            return await self._handle_hot_command(stripped)
 
         # Setup interrupt handler
         self._setup_interrupt_handler()
@@ -149,11 +279,12 @@ class Agent:
 
     async def _run_loop(self, user_input: str) -> str | None:
         """Internal run loop with interrupt support."""
-        # Build messages
-        messages = self._build_messages(user_input)
-
-        # Add user message to context
+        # Add user message to context, then build messages from context alone
         self.context.add_message(Message(role="user", content=user_input))
+        messages = self._build_messages()
+
+        # Tool set is fixed for the duration of a run
+        tool_schemas = self.tools.all_schemas()
 
         # Run agent loop
         iteration = 0
@@ -163,13 +294,11 @@ class Agent:
             # Check for interrupt at start of each iteration
             new_instruction = self._check_interrupted()
             if new_instruction == "__STOP__":
-                self.console.print("[yellow]Stopped by user.[/yellow]")
+                self.console.print(_STOPPED)
                 return None
             elif new_instruction:
                 # User provided new instruction - add it and continue
-                self.console.print(f"[bold blue]📝 New instruction:[/bold blue] {new_instruction}")
-                messages.append(Message(role="user", content=new_instruction))
-                self.context.add_message(Message(role="user", content=new_instruction))
+                self._add_new_instruction(messages, new_instruction)
                 iteration = 0  # Reset iteration count for new instruction
 
             iteration += 1
@@ -191,8 +320,7 @@ class Agent:
                         # Let user add more context
                         extra = Prompt.ask("[bold yellow]Add instruction[/bold yellow]")
                         if extra.strip():
-                            messages.append(Message(role="user", content=extra.strip()))
-                            self.context.add_message(Message(role="user", content=extra.strip()))
+                            self._add_message(messages, Message(role="user", content=extra.strip()))
 
                     # Reset counter and continue
                     iteration = 1
@@ -210,11 +338,24 @@ class Agent:
                 # Show thinking indicator while waiting for LLM
                 self._start_thinking()
 
-                # Get LLM response
-                response = await self.provider.chat(
-                    messages,
-                    tools=self.tools.all_schemas(),
-                )
+                # Bound the prompt size however long the tool loop runs
+                request_messages = self.context.trim_to_budget(messages, self.config.context_budget)
+
+                # Get LLM response (from cache if this exact request was answered before)
+                cache = self.response_cache
+                cache_key = self._cache_key(request_messages, tool_schemas) if cache else None
+                cached = cache.get(cache_key) if cache and cache_key and self._use_cache else None
+                streamed = False
+                if cached:
+                    response = cached
+                elif self.console.is_terminal:
+                    # Print tokens as they arrive instead of waiting for the full reply
+                    response = await self._stream_response(request_messages, tool_schemas)
+                    streamed = True
+                else:
+                    response = await self.provider.chat(request_messages, tools=tool_schemas)
+                if cache and cache_key and not cached:
+                    cache.put(cache_key, response)
 
                 # Stop thinking indicator
                 self._stop_thinking()
@@ -227,8 +368,11 @@ class Agent:
                 # If no tool calls, we're done
                 if not response.tool_calls:
                     if response.content:
-                        self.console.print()
-                        self.console.print(f"[bold green]MaShell:[/bold green] {response.content}")
+                        if not streamed:
+                            self.console.print()
+                            self.console.print(Text.assemble(_MASHELL_PREFIX, response.content))
+                        if cached:
+                            self.console.print(_CACHED)
                         self.context.add_message(
                             Message(role="assistant", content=response.content)
                         )
@@ -247,113 +391,247 @@ class Agent:
                     content=response.content,
                     tool_calls=response.tool_calls,
                 )
-                messages.append(assistant_msg)
-                self.context.add_message(assistant_msg)
+                self._add_message(messages, assistant_msg)
 
-                # Show thinking if any
-                if response.content:
+                # Show thinking if any (already shown if streamed)
+                if response.content and not streamed:
                     self.console.print()
-                    self.console.print(f"[bold cyan]💭[/bold cyan] {response.content}")
+                    self.console.print(Text.assemble(_THOUGHT_PREFIX, response.content))
 
-                # Execute tool calls
+                # Execute tool calls (consecutive read-only calls run concurrently)
                 tool_calls_list = list(response.tool_calls)
-                for i, tool_call in enumerate(tool_calls_list):
+                i = 0
+                while i < len(tool_calls_list):
                     # Check interrupt before each tool execution
                     new_instruction = self._check_interrupted()
                     if new_instruction == "__STOP__":
-                        self.console.print("[yellow]Stopped by user.[/yellow]")
+                        self.console.print(_STOPPED)
                         return None
                     elif new_instruction:
                         # Add cancelled results for remaining tool calls
                         # (API requires all tool_calls have results)
-                        for remaining_call in tool_calls_list[i:]:
-                            cancelled_msg = Message(
-                                role="tool",
-                                content="[Cancelled by user]",
-                                tool_call_id=remaining_call.id,
-                            )
-                            messages.append(cancelled_msg)
-                            self.context.add_message(cancelled_msg)
-
-                        self.console.print(
-                            f"[bold blue]📝 New instruction:[/bold blue] {new_instruction}"
-                        )
-                        messages.append(Message(role="user", content=new_instruction))
-                        self.context.add_message(Message(role="user", content=new_instruction))
+                        self._cancel_tool_calls(messages, tool_calls_list[i:])
+                        self._add_new_instruction(messages, new_instruction)
                         break  # Exit tool loop to process new instruction
 
-                    result = await self._execute_tool(tool_call)
+                    batch = self._next_tool_batch(tool_calls_list, i)
+                    if len(batch) > 1:
+                        results = await self._execute_tool_batch(batch)
+                    else:
+                        results = [await self._execute_tool(batch[0])]
+                    i += len(batch)
 
                     # Check interrupt AFTER tool execution (user may have pressed Ctrl+C during)
                     new_instruction = self._check_interrupted()
                     if new_instruction == "__STOP__":
-                        self.console.print("[yellow]Stopped by user.[/yellow]")
+                        self.console.print(_STOPPED)
                         return None
-                    elif new_instruction:
-                        # Add tool result first
+
+                    # Add tool results in original order
+                    for tool_call, result in zip(batch, results):
                         tool_msg = Message(
                             role="tool",
                             content=result.output if result.success else f"Error: {result.error}",
                             tool_call_id=tool_call.id,
                         )
-                        messages.append(tool_msg)
-                        self.context.add_message(tool_msg)
+                        self._add_message(messages, tool_msg)
 
-                        # Add cancelled results for remaining tool calls
-                        for remaining_call in tool_calls_list[i + 1 :]:
-                            cancelled_msg = Message(
-                                role="tool",
-                                content="[Cancelled by user]",
-                                tool_call_id=remaining_call.id,
-                            )
-                            messages.append(cancelled_msg)
-                            self.context.add_message(cancelled_msg)
-
-                        self.console.print(
-                            f"[bold blue]📝 New instruction:[/bold blue] {new_instruction}"
-                        )
-                        messages.append(Message(role="user", content=new_instruction))
-                        self.context.add_message(Message(role="user", content=new_instruction))
+                    if new_instruction:
+                        self._cancel_tool_calls(messages, tool_calls_list[i:])
+                        self._add_new_instruction(messages, new_instruction)
                         break  # Exit tool loop to process new instruction
 
-                    # Add tool result
-                    tool_msg = Message(
-                        role="tool",
-                        content=result.output if result.success else f"Error: {result.error}",
-                        tool_call_id=tool_call.id,
-                    )
-                    messages.append(tool_msg)
-                    self.context.add_message(tool_msg)
-
             except Exception as e:
                 self._stop_thinking()
                 self.console.print(f"[red]Error: {rich_escape(str(e))}[/red]")
                 if self.verbose:
-                    import traceback
-
                     self.console.print(f"[dim]{rich_escape(traceback.format_exc())}[/dim]")
                 return None
 
-    def _build_messages(self, user_input: str) -> list[Message]:
-        """Build the message list for the LLM."""
-        messages: list[Message] = []
+    def _build_messages(self) -> list[Message]:
+        """Build the message list for the LLM.
 
-        # System prompt
+        Called once per run; the loop then extends the list incrementally via _add_message.
+        """
         system_prompt = get_system_prompt(self.config.working_dir)
-        messages.append(Message(role="system", content=system_prompt))
 
-        # Get context messages (includes any compressed history)
-        context_messages = self.context.get_messages()
+        # Context messages (includes any compressed history), minus stale system messages
+        return [Message(role="system", content=system_prompt)] + [
+            msg for msg in self.context.get_messages() if msg.role != "system"
+        ]
+
+    def _cache_key(self, messages: list[Message], tools: list[dict[str, Any]]) -> str:
+        """Hash a request for the response cache, ignoring the time in the system prompt."""
+        if messages and messages[0].role == "system":
+            # The prompt embeds the current minute, which would make every key unique
+            template = get_system_prompt_template(self.config.working_dir)
+            messages = [Message(role="system", content=template), *messages[1:]]
+        return self.provider.request_key(messages, tools)
+
+    def _add_message(self, messages: list[Message], message: Message) -> None:
+        """Append a message to the outgoing list and record it in context."""
+        messages.append(message)
+        self.context.add_message(message)
+
+    async def _stream_response(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]],
+    ) -> Response:
+        """Stream an LLM response, printing content as it arrives."""
+        content_parts: list[str] = []
+        tool_calls: list[ToolCall] = []
+        finish_reason = "stop"
+        usage: dict[str, int] = {}
+
+        async for delta in self.provider.chat_stream(messages, tools=tools):
+            if delta.content:
+                if not content_parts:
+                    # First token replaces the thinking indicator
+                    self._stop_thinking()
+                    self.console.print()
+                    self.console.print(_MASHELL_PREFIX, end="")
+                self.console.print(
+                    delta.content, end="", markup=False, highlight=False, soft_wrap=True
+                )
+                content_parts.append(delta.content)
+            if delta.tool_calls:
+                tool_calls.extend(delta.tool_calls)
+            if delta.finish_reason:
+                finish_reason = delta.finish_reason
+            if delta.usage:
+                usage = delta.usage
+
+        if content_parts:
+            self.console.print()
+
+        return Response(
+            content="".join(content_parts) or None,
+            tool_calls=tool_calls or None,
+            finish_reason=finish_reason,
+            usage=usage,
+        )
 
-        # Filter out any existing system messages from context
-        for msg in context_messages:
-            if msg.role != "system":
-                messages.append(msg)
+    async def _handle_hot_command(self, command: str) -> str | None:
+        """Handle a hot command such as '!mashell:stats'."""
+        name, _, rest = command[len(HOT_COMMAND_PREFIX) :].partition(" ")
+        handler = self._hot_commands.get(name)
+        if handler is None:
+            available = ", ".join(HOT_COMMAND_PREFIX + n for n in self._hot_commands)
+            self.console.print(
+                f"[yellow]Unknown command.[/yellow] [dim]Available: {available}[/dim]"
+            )
+            return None
+        return await handler(rest.strip())
 
-        # Add new user input
-        messages.append(Message(role="user", content=user_input))
+    async def _hot_skip(self, prompt: str) -> str | None:
+        """Run a prompt without reading from the response cache."""
+        if not prompt:
+            self.console.print(f"[dim]Usage: {HOT_COMMAND_PREFIX}skip <prompt>[/dim]")
+            return None
+        self._use_cache = False
+        try:
+            return await self.run(prompt)
+        finally:
+            self._use_cache = True
 
-        return messages
+    async def _hot_bust(self, _: str) -> str | None:
+        """Clear the response cache."""
+        if self.response_cache is None:
+            self.console.print(_CACHE_OFF)
+            return None
+        count = self.response_cache.clear()
+        self.console.print(f"[green]✓[/green] Cleared {count} cached response(s)")
+        return None
+
+    async def _hot_stats(self, _: str) -> str | None:
+        """Show response cache statistics."""
+        cache = self.response_cache
+        if cache is None:
+            self.console.print(_CACHE_OFF)
+            return None
+        self.console.print(
+            f"[dim]Response cache: {cache.count()} entries, "
+            f"{cache.hits} hits, {cache.misses} misses this session[/dim]"
+        )
+        return None
+
+    async def _hot_revoke(self, _: str) -> str | None:
+        """Forget recent tool call approvals."""
+        count = self.permissions.revoke_approvals()
+        self.console.print(f"[green]✓[/green] Revoked {count} cached approval(s)")
+        return None
+
+    def _cancel_tool_calls(self, messages: list[Message], tool_calls: list[ToolCall]) -> None:
+        """Add cancelled results for tool calls that will not be executed."""
+        for tool_call in tool_calls:
+            cancelled_msg = Message(
+                role="tool",
+                content="[Cancelled by user]",
+                tool_call_id=tool_call.id,
+            )
+            self._add_message(messages, cancelled_msg)
+
+    def _add_new_instruction(self, messages: list[Message], new_instruction: str) -> None:
+        """Show and record a new instruction given after an interrupt."""
+        self.console.print(Text.assemble(_NEW_INSTRUCTION_PREFIX, new_instruction))
+        self._add_message(messages, Message(role="user", content=new_instruction))
+
+    def _is_concurrency_safe(self, tool_call: ToolCall) -> bool:
+        """Check if a tool call can run alongside other tool calls."""
+        tool = self.tools.get(tool_call.name)
+        return tool is not None and tool.concurrency_safe and not tool.requires_permission
+
+    def _next_tool_batch(self, tool_calls: list[ToolCall], start: int) -> list[ToolCall]:
+        """Get the next run of tool calls to execute together.
+
+        Consecutive concurrency-safe calls are grouped; any other call runs alone.
+        """
+        end = start + 1
+        if self._is_concurrency_safe(tool_calls[start]):
+            while end < len(tool_calls) and self._is_concurrency_safe(tool_calls[end]):
+                end += 1
+        return tool_calls[start:end]
+
+    async def _execute_tool_batch(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+        """Execute concurrency-safe tool calls concurrently.
+
+        Results are displayed afterwards in the original order so output never interleaves.
+        """
+
+        async def run_one(tool_call: ToolCall) -> ToolResult:
+            tool = self.tools.get(tool_call.name)
+            if not tool:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Unknown tool: {tool_call.name}",
+                )
+            return await self._call_tool(tool, tool_call.arguments)
+
+        self._start_status(f"Running {len(tool_calls)} tools...", "⚡")
+        try:
+            outcomes = await asyncio.gather(
+                *(run_one(tc) for tc in tool_calls),
+                return_exceptions=True,
+            )
+        finally:
+            self._stop_thinking()
+
+        results: list[ToolResult] = []
+        for tool_call, outcome in zip(tool_calls, outcomes):
+            if isinstance(outcome, BaseException):
+                result = ToolResult(success=False, output="", error=str(outcome))
+            else:
+                result = outcome
+            cmd_display, _ = self._render_tool_call(tool_call)
+            # One render pass per tool: command and result together
+            self.console.print(
+                Group(self._tool_start_display(cmd_display), self._tool_result_display(result))
+            )
+            results.append(result)
+
+        return results
 
     async def _execute_tool(self, tool_call: ToolCall) -> ToolResult:
         """Execute a tool call with permission checking."""
@@ -366,21 +644,22 @@ class Agent:
                 error=f"Unknown tool: {tool_call.name}",
             )
 
-        # Get command for display
-        cmd_display = self._get_command_display(tool_call)
+        # Get command for display and permission description in one pass
+        cmd_display, description = self._render_tool_call(tool_call)
 
         # Check permission
         if tool.requires_permission:
             request = PermissionRequest(
                 tool_name=tool.name,
                 arguments=tool_call.arguments,
-                description=self._describe_tool_call(tool_call),
+                description=description,
+                cacheable=tool.cache_approval,
             )
 
             permission = await self.permissions.check(request)
 
             if not permission.approved:
-                self.console.print("[yellow]⏹ Cancelled[/yellow]")
+                self.console.print(_CANCELLED)
                 return ToolResult(
                     success=False,
                     output="",
@@ -396,9 +675,7 @@ class Agent:
             args = tool_call.arguments
 
         # Show execution start
-        self.console.print()
-        self.console.print("[bold yellow]▶ Run:[/bold yellow]")
-        self.console.print(f"  [cyan]$ {rich_escape(cmd_display)}[/cyan]")
+        self._show_tool_start(cmd_display)
 
         # Get tool-specific status message
         status_msg = self._get_tool_status_message(tool_call.name)
@@ -406,125 +683,64 @@ class Agent:
         # Execute with status indicator
         self._start_status(status_msg, "⚡")
         try:
-            result = await tool.execute(**args)
+            result = await self._call_tool(tool, args)
         finally:
             self._stop_thinking()
 
         # Show result
-        if result.success:
-            if result.output.strip():
-                # Truncate long output
-                lines = result.output.strip().split("\n")
-                if len(lines) > 15:
-                    more = len(lines) - 12
-                    display_lines = lines[:12] + [f"  ... ({more} more lines)"]
-                    output_display = "\n".join(display_lines)
-                else:
-                    output_display = result.output.strip()
-
-                self.console.print("[bold blue]📋 Output:[/bold blue]")
-                self.console.print(f"[dim]{rich_escape(output_display)}[/dim]")
-            else:
-                self.console.print("[green]✓ Done[/green]")
-        else:
-            err_msg = rich_escape(result.error or "Unknown error")
-            self.console.print(f"[bold red]✗ Failed:[/bold red] {err_msg}")
+        self._show_tool_result(result)
 
         return result
 
-    def _get_command_display(self, tool_call: ToolCall) -> str:
-        """Get the command string for display."""
-        if tool_call.name == "shell":
-            return str(tool_call.arguments.get("command", ""))
-        elif tool_call.name == "run_background":
-            return str(tool_call.arguments.get("command", ""))
-        elif tool_call.name == "check_background":
-            return f"check_background({tool_call.arguments.get('task_id', '')})"
-        elif tool_call.name == "read_file":
-            path = tool_call.arguments.get("path", "")
-            start = tool_call.arguments.get("start_line")
-            end = tool_call.arguments.get("end_line")
-            if start or end:
-                return f"read_file({path!r}, lines={start or 1}-{end or 'end'})"
-            return f"read_file({path!r})"
-        elif tool_call.name == "list_dir":
-            path = tool_call.arguments.get("path", ".")
-            pattern = tool_call.arguments.get("pattern")
-            if pattern:
-                return f"list_dir({path!r}, pattern={pattern!r})"
-            return f"list_dir({path!r})"
-        elif tool_call.name == "search_files":
-            pattern = tool_call.arguments.get("pattern", "")
-            path = tool_call.arguments.get("path", ".")
-            return f"search_files({pattern!r}, path={path!r})"
-        elif tool_call.name == "write_file":
-            path = tool_call.arguments.get("path", "")
-            content = tool_call.arguments.get("content", "")
-            return f"write_file({path!r}, {len(content)} chars)"
-        elif tool_call.name == "crawl":
-            query = tool_call.arguments.get("query", "")
-            return f"crawl({query!r})"
-        elif tool_call.name == "fetch_page":
-            url = tool_call.arguments.get("url", "")
-            return f"fetch_page({url!r})"
-        elif tool_call.name == "edit_docx":
-            path = tool_call.arguments.get("path", "")
-            ops = tool_call.arguments.get("operations", [])
-            save_as = tool_call.arguments.get("save_as")
-            if save_as:
-                return f"edit_docx({path!r}, {len(ops)} ops, save_as={save_as!r})"
-            return f"edit_docx({path!r}, {len(ops)} ops)"
+    async def _call_tool(self, tool: BaseTool, args: dict[str, Any]) -> ToolResult:
+        """Run a tool, offloading synchronous implementations to a worker thread."""
+        if inspect.iscoroutinefunction(tool.execute):
+            return await cast(Awaitable[ToolResult], tool.execute(**args))
+        return cast(ToolResult, await asyncio.to_thread(tool.execute, **args))
+
+    def _show_tool_start(self, cmd_display: str) -> None:
+        """Show the command about to be executed."""
+        self.console.print(self._tool_start_display(cmd_display))
+
+    def _show_tool_result(self, result: ToolResult) -> None:
+        """Show the result of a tool execution."""
+        self.console.print(self._tool_result_display(result))
+
+    def _tool_start_display(self, cmd_display: str) -> Group:
+        """Build the display for a command about to be executed."""
+        return Group(Text(), _RUN_HDR, Text(f"  $ {cmd_display}", style="cyan"))
+
+    def _tool_result_display(self, result: ToolResult) -> Group:
+        """Build the display for the result of a tool execution."""
+        if not result.success:
+            return Group(Text.assemble(_FAILED_PREFIX, result.error or "Unknown error"))
+
+        output = result.output.strip()
+        if not output:
+            return Group(_DONE)
+
+        # Truncate long output to its first 12 lines without splitting all of it
+        total_lines = output.count("\n") + 1
+        if total_lines > 15:
+            end = -1
+            for _ in range(12):
+                end = output.find("\n", end + 1)
+            output_display = f"{output[:end]}\n  ... ({total_lines - 12} more lines)"
         else:
-            return f"{tool_call.name}({tool_call.arguments})"
-
-    def _describe_tool_call(self, tool_call: ToolCall) -> str:
-        """Generate a human-readable description of a tool call."""
-        if tool_call.name == "shell":
-            cmd = tool_call.arguments.get("command", "")
-            return f"Execute shell command: {cmd}"
-        elif tool_call.name == "run_background":
-            cmd = tool_call.arguments.get("command", "")
-            return f"Run in background: {cmd}"
-        elif tool_call.name == "check_background":
-            task_id = tool_call.arguments.get("task_id", "")
-            return f"Check background task: {task_id}"
-        elif tool_call.name == "read_file":
-            path = tool_call.arguments.get("path", "")
-            return f"Read file: {path}"
-        elif tool_call.name == "list_dir":
-            path = tool_call.arguments.get("path", ".")
-            return f"List directory: {path}"
-        elif tool_call.name == "search_files":
-            pattern = tool_call.arguments.get("pattern", "")
-            path = tool_call.arguments.get("path", ".")
-            return f"Search for '{pattern}' in {path}"
-        elif tool_call.name == "write_file":
-            path = tool_call.arguments.get("path", "")
-            return f"Write to file: {path}"
-        elif tool_call.name == "crawl":
-            query = tool_call.arguments.get("query", "")
-            return f"Web search: {query}"
-        elif tool_call.name == "fetch_page":
-            url = tool_call.arguments.get("url", "")
-            return f"Fetch page: {url}"
-        elif tool_call.name == "edit_docx":
-            path = tool_call.arguments.get("path", "")
-            return f"Edit Word document: {path}"
-        else:
-            return f"{tool_call.name}: {tool_call.arguments}"
+            output_display = output
+
+        return Group(_OUTPUT_HDR, Text(output_display, style="dim"))
+
+    def _render_tool_call(self, tool_call: ToolCall) -> tuple[str, str]:
+        """Get the display command and human-readable description of a tool call."""
+        renderer = _TOOL_RENDERERS.get(tool_call.name)
+        if renderer is None:
+            return (
+                f"{tool_call.name}({tool_call.arguments})",
+                f"{tool_call.name}: {tool_call.arguments}",
+            )
+        return renderer(tool_call.arguments)
 
     def _get_tool_status_message(self, tool_name: str) -> str:
         """Get a status message for the tool execution."""
-        status_messages = {
-            "shell": "Executing command...",
-            "run_background": "Starting background task...",
-            "check_background": "Checking task status...",
-            "read_file": "Reading file...",
-            "list_dir": "Listing directory...",
-            "search_files": "Searching files...",
-            "write_file": "Writing file...",
-            "crawl": "Crawling web...",
-            "fetch_page": "Fetching page...",
-            "edit_docx": "Editing Word document...",
-        }
-        return status_messages.get(tool_name, f"Running {tool_name}...")
+        return _TOOL_STATUS_MESSAGES.get(tool_name, f"Running {tool_name}...")
@@ -1,50 +1,53 @@
 """System prompts and templates."""
 
+import functools
 import os
 import platform
 from datetime import datetime
+from string import Template
 
 
-def get_system_prompt(working_dir: str | None = None) -> str:
-    """Get the system prompt for MaShell."""
-
-    # Detect current system
+def _detect_os_display() -> str:
+    """Describe the current OS, e.g. 'macOS 14.5'."""
     system_name = platform.system()  # Darwin, Linux, Windows
     system_release = platform.release()
 
     if system_name == "Darwin":
-        os_display = f"macOS {platform.mac_ver()[0]}"
+        return f"macOS {platform.mac_ver()[0]}"
     elif system_name == "Linux":
-        os_display = f"Linux {system_release}"
+        return f"Linux {system_release}"
     elif system_name == "Windows":
-        os_display = f"Windows {system_release}"
-    else:
-        os_display = f"{system_name} {system_release}"
+        return f"Windows {system_release}"
+    return f"{system_name} {system_release}"
 
-    cwd = working_dir or os.getcwd()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
-    shell = os.environ.get("SHELL", "/bin/bash")
-    user = os.environ.get("USER", "user")
 
-    macos_notes = (
-        """
+# Environment details fixed for the lifetime of the process
+_OS_DISPLAY = _detect_os_display()
+_SHELL = os.environ.get("SHELL", "/bin/bash")
+_USER = os.environ.get("USER", "user")
+_MACOS_NOTES = (
+    """
 ## macOS Specific Notes
 - Use `brew` for package management
 - Use `open` to open files/URLs in default app
 - Use `pbcopy`/`pbpaste` for clipboard
 - `sed -i ''` (empty string) for in-place editing
 """
-        if system_name == "Darwin"
-        else ""
-    )
+    if platform.system() == "Darwin"
+    else ""
+)
 
-    return f"""You are MaShell, an autonomous problem-solving agent.
+# Placeholder for the only per-call value in the otherwise static system prompt
+_TIME_PLACEHOLDER = "$current_time"
+
+_SYSTEM_PROMPT_TEMPLATE = Template(
+    """You are MaShell, an autonomous problem-solving agent.
 
 ## System
-- OS: {os_display} | Shell: {shell} | User: {user}
-- Working Directory: {cwd}
-- Time: {current_time}
-{macos_notes}
+- OS: $os_display | Shell: $shell | User: $user
+- Working Directory: $cwd
+- Time: $current_time
+$macos_notes
 ## Language
 Always respond in the user's language.
 
@@ -138,6 +141,31 @@ Stop ONLY when:
 During exploration: Keep it brief - quick reasoning, tool call, observation.
 When done: Clear summary with the final answer.
 """
+)
+
+
+def get_system_prompt_template(working_dir: str | None = None) -> str:
+    """Get the system prompt with the time left as a placeholder, e.g. for cache keys."""
+    return _get_static_system_prompt(working_dir or os.getcwd())
+
+
+def get_system_prompt(working_dir: str | None = None) -> str:
+    """Get the system prompt for MaShell."""
+    cwd = working_dir or os.getcwd()
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+    return _get_static_system_prompt(cwd).replace(_TIME_PLACEHOLDER, current_time)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_static_system_prompt(cwd: str) -> str:
+    """Build the system prompt with a time placeholder (cached per working dir)."""
+    return _SYSTEM_PROMPT_TEMPLATE.safe_substitute(
+        os_display=_OS_DISPLAY,
+        shell=_SHELL,
+        user=_USER,
+        cwd=cwd,
+        macos_notes=_MACOS_NOTES,
+    )
 
 
 def get_task_memory_prompt(
@@ -1,119 +1,222 @@
 """CLI argument parsing and main entry point."""
 
 import argparse
-import asyncio
+import functools
 import sys
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-
-from mashell.agent.core import Agent
-from mashell.config import Config, get_config_path, load_config
-from mashell.logo import display_logo
-from mashell.session import SessionManager
+from mashell import __version__
 
+# Heavy imports (rich, the agent and provider stack) happen inside the functions
+# that need them, so `mashell --help` and `mashell init` start quickly.
 if TYPE_CHECKING:
-    pass
-
-# Provider presets for easy configuration
-PROVIDER_PRESETS = {
-    "openai": {
-        "url": "https://api.openai.com/v1",
-        "default_model": "gpt-4o",
-        "needs_key": True,
-    },
-    "azure": {
-        "url": "",  # User must provide
-        "default_model": "",  # User must provide deployment name
-        "needs_key": True,
-    },
-    "anthropic": {
-        "url": "https://api.anthropic.com",
-        "default_model": "claude-sonnet-4-20250514",
-        "needs_key": True,
-    },
-    "ollama": {
-        "url": "http://localhost:11434",
-        "default_model": "qwen2.5:14b",
-        "needs_key": False,
-    },
-}
-
-
-def run_init(console: Console) -> None:
-    """Interactive configuration wizard."""
-    import yaml
+    import asyncio
+    from collections.abc import Coroutine
+    from datetime import datetime
 
-    console.print("\n[bold cyan]🐚 MaShell Configuration Wizard[/bold cyan]\n")
-    console.print("Let's set up your AI provider configuration.\n")
+    from rich.console import Console
+    from rich.text import Text
+
+    from mashell.agent.core import Agent
+    from mashell.config import Config
+    from mashell.session import SessionData, SessionManager
+
+# Provider presets for easy configuration (read-only)
+PROVIDER_PRESETS: Mapping[str, Mapping[str, str | bool]] = MappingProxyType(
+    {
+        "openai": MappingProxyType(
+            {
+                "url": "https://api.openai.com/v1",
+                "default_model": "gpt-4o",
+                "needs_key": True,
+            }
+        ),
+        "azure": MappingProxyType(
+            {
+                "url": "",  # User must provide
+                "default_model": "",  # User must provide deployment name
+                "needs_key": True,
+            }
+        ),
+        "anthropic": MappingProxyType(
+            {
+                "url": "https://api.anthropic.com",
+                "default_model": "claude-sonnet-4-20250514",
+                "needs_key": True,
+            }
+        ),
+        "ollama": MappingProxyType(
+            {
+                "url": "http://localhost:11434",
+                "default_model": "qwen2.5:14b",
+                "needs_key": False,
+            }
+        ),
+    }
+)
+
+# The init wizard accepts a provider name or its 1-based menu number
+_PROVIDERS = tuple(PROVIDER_PRESETS)
+_PROVIDER_CHOICES = [*_PROVIDERS, *(str(i) for i in range(1, len(_PROVIDERS) + 1))]
+
+_T = TypeVar("_T")
+
+
+@functools.cache
+def _runner() -> "asyncio.Runner":
+    """Get the event loop runner shared by every coroutine the CLI runs."""
+    import asyncio
+    import atexit
+
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        runner = asyncio.Runner()
+    else:
+        runner = asyncio.Runner(loop_factory=uvloop.new_event_loop)
+    atexit.register(runner.close)
+    return runner
+
+
+def _run_async(coro: "Coroutine[Any, Any, _T]") -> _T:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    return _runner().run(coro)
+
+
+def _ask(
+    prompt: str,
+    default: str | None = None,
+    choices: list[str] | None = None,
+    password: bool = False,
+) -> str:
+    """Ask for a value, with Rich on a terminal and plain input() when piped."""
+    if sys.stdin.isatty():
+        from rich.prompt import Prompt
+
+        if default is None:
+            return Prompt.ask(prompt, choices=choices, password=password)
+        return Prompt.ask(prompt, choices=choices, password=password, default=default)
+
+    options = f" [{'/'.join(choices)}]" if choices else ""
+    suffix = f" ({default})" if default else ""
+    while True:
+        answer = _input_line(f"{prompt}{options}{suffix}: ")
+        if answer is None:
+            if default is None:
+                raise SystemExit(f"No answer for: {prompt}")
+            return default
+        answer = answer.strip() or default or ""
+        if not choices or answer in choices:
+            return answer
+        print("Please select one of the available options")
 
-    # Step 1: Choose provider
-    console.print("[bold]Step 1:[/bold] Choose your LLM provider")
-    console.print("  [dim]1.[/dim] openai    - OpenAI API (GPT-4o, etc.)")
-    console.print("  [dim]2.[/dim] azure     - Azure OpenAI Service")
-    console.print("  [dim]3.[/dim] anthropic - Anthropic API (Claude)")
-    console.print("  [dim]4.[/dim] ollama    - Local Ollama (no API key needed)")
-    console.print()
 
-    provider = Prompt.ask(
+def _confirm(prompt: str, default: bool = True) -> bool:
+    """Ask a yes/no question, with Rich on a terminal and plain input() when piped."""
+    if sys.stdin.isatty():
+        from rich.prompt import Confirm
+
+        return Confirm.ask(prompt, default=default)
+
+    while True:
+        answer = _input_line(f"{prompt} [y/n] ({'y' if default else 'n'}): ")
+        if answer is None:
+            return default
+        answer = answer.strip().lower()
+        if not answer:
+            return default
+        if answer in ("y", "yes", "n", "no"):
+            return answer.startswith("y")
+        print("Please enter Y or N")
+
+
+def _input_line(prompt: str) -> str | None:
+    """Read a line from piped stdin, or None once it is exhausted."""
+    try:
+        return input(prompt)
+    except EOFError:
+        print()
+        return None
+
+
+def run_init(console: "Console") -> None:
+    """Interactive configuration wizard."""
+    from mashell.config import get_config_path, read_config_file, write_config_file
+
+    console.print(
+        "\n[bold cyan]🐚 MaShell Configuration Wizard[/bold cyan]\n\n"
+        "Let's set up your AI provider configuration.\n\n"
+        "[bold]Step 1:[/bold] Choose your LLM provider\n"
+        "  [dim]1.[/dim] openai    - OpenAI API (GPT-4o, etc.)\n"
+        "  [dim]2.[/dim] azure     - Azure OpenAI Service\n"
+        "  [dim]3.[/dim] anthropic - Anthropic API (Claude)\n"
+        "  [dim]4.[/dim] ollama    - Local Ollama (no API key needed)\n"
+    )
+
+    provider = _ask(
         "Select provider",
-        choices=["openai", "azure", "anthropic", "ollama", "1", "2", "3", "4"],
+        choices=_PROVIDER_CHOICES,
         default="openai",
     )
 
-    # Map numbers to provider names
-    provider_map = {"1": "openai", "2": "azure", "3": "anthropic", "4": "ollama"}
-    provider = provider_map.get(provider, provider)
+    # Map numbers to provider names (choices guarantee a valid index)
+    if provider.isdigit():
+        provider = _PROVIDERS[int(provider) - 1]
 
     preset = PROVIDER_PRESETS[provider]
-    console.print(f"\n[green]✓[/green] Selected: [bold]{provider}[/bold]\n")
 
+    # Each step prints the previous step's result and its own header in one call
     # Step 2: API URL
-    console.print("[bold]Step 2:[/bold] API Endpoint URL")
+    step = (
+        f"\n[green]✓[/green] Selected: [bold]{provider}[/bold]\n\n"
+        "[bold]Step 2:[/bold] API Endpoint URL"
+    )
     if provider == "azure":
-        console.print("  [dim]Example: https://your-resource.openai.azure.com/[/dim]")
-        url = Prompt.ask("Enter your Azure OpenAI endpoint")
+        console.print(f"{step}\n  [dim]Example: https://your-resource.openai.azure.com/[/dim]")
+        url = _ask("Enter your Azure OpenAI endpoint")
     elif preset["url"]:
-        console.print(f"  [dim]Default: {preset['url']}[/dim]")
-        url = Prompt.ask("API URL", default=str(preset["url"]))
+        console.print(f"{step}\n  [dim]Default: {preset['url']}[/dim]")
+        url = _ask("API URL", default=str(preset["url"]))
     else:
-        url = Prompt.ask("API URL")
-
-    console.print(f"[green]✓[/green] URL: [bold]{url}[/bold]\n")
+        console.print(step)
+        url = _ask("API URL")
 
     # Step 3: API Key (if needed)
+    step = f"[green]✓[/green] URL: [bold]{url}[/bold]\n\n[bold]Step 3:[/bold] API Key"
     key = None
     if preset["needs_key"]:
-        console.print("[bold]Step 3:[/bold] API Key")
-        console.print("  [dim]Your key will be saved securely in the config file.[/dim]")
-        key = Prompt.ask("Enter your API key", password=True)
-        console.print("[green]✓[/green] API key saved\n")
+        console.print(f"{step}\n  [dim]Your key will be saved securely in the config file.[/dim]")
+        key = _ask("Enter your API key", password=True)
+        key_status = "[green]✓[/green] API key saved"
     else:
-        console.print("[bold]Step 3:[/bold] API Key")
-        console.print("  [dim]Not required for local models.[/dim]")
-        console.print(f"[green]✓[/green] Skipped (not needed for {provider})\n")
+        console.print(f"{step}\n  [dim]Not required for local models.[/dim]")
+        key_status = f"[green]✓[/green] Skipped (not needed for {provider})"
 
     # Step 4: Model name
-    console.print("[bold]Step 4:[/bold] Model / Deployment Name")
+    step = f"{key_status}\n\n[bold]Step 4:[/bold] Model / Deployment Name"
     if provider == "azure":
-        console.print("  [dim]Enter your Azure deployment name (e.g., gpt-4o, gpt-35-turbo)[/dim]")
-        model = Prompt.ask("Deployment name")
+        console.print(
+            f"{step}\n  [dim]Enter your Azure deployment name (e.g., gpt-4o, gpt-35-turbo)[/dim]"
+        )
+        model = _ask("Deployment name")
     elif preset["default_model"]:
-        console.print(f"  [dim]Default: {preset['default_model']}[/dim]")
-        model = Prompt.ask("Model name", default=str(preset["default_model"]))
+        console.print(f"{step}\n  [dim]Default: {preset['default_model']}[/dim]")
+        model = _ask("Model name", default=str(preset["default_model"]))
     else:
-        model = Prompt.ask("Model name")
-
-    console.print(f"[green]✓[/green] Model: [bold]{model}[/bold]\n")
+        console.print(step)
+        model = _ask("Model name")
 
     # Step 5: Profile name
-    console.print("[bold]Step 5:[/bold] Profile Name")
-    console.print("  [dim]Save this configuration as a named profile for easy reuse.[/dim]")
+    console.print(
+        f"[green]✓[/green] Model: [bold]{model}[/bold]\n\n"
+        "[bold]Step 5:[/bold] Profile Name\n"
+        "  [dim]Save this configuration as a named profile for easy reuse.[/dim]"
+    )
     default_profile = provider
-    profile_name = Prompt.ask("Profile name", default=default_profile)
+    profile_name = _ask("Profile name", default=default_profile)
 
     # Build config
     config_path = get_config_path()
@@ -121,8 +224,7 @@ def run_init(console: Console) -> None:
 
     # Load existing config or create new
     if config_path.exists():
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = read_config_file(config_path)
     else:
         config_data = {}
 
@@ -147,25 +249,26 @@ def run_init(console: Console) -> None:
 
     # Save config
     config_dir.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+    write_config_file(config_path, config_data)
 
-    console.print("\n[bold green]✅ Configuration saved![/bold green]")
-    console.print(f"   Config file: [dim]{config_path}[/dim]")
-    console.print(f"   Profile name: [bold]{profile_name}[/bold]")
-    console.print()
-    console.print("[bold]To use this profile:[/bold]")
-    console.print(f'   [cyan]mashell --profile {profile_name} "your prompt here"[/cyan]')
-    console.print()
+    console.print(
+        "\n[bold green]✅ Configuration saved![/bold green]\n"
+        f"   Config file: [dim]{config_path}[/dim]\n"
+        f"   Profile name: [bold]{profile_name}[/bold]\n\n"
+        "[bold]To use this profile:[/bold]\n"
+        f'   [cyan]mashell --profile {profile_name} "your prompt here"[/cyan]\n'
+    )
 
     # Offer to test
-    if Confirm.ask("Would you like to test the configuration now?", default=True):
+    if _confirm("Would you like to test the configuration now?", default=True):
         console.print("\n[dim]Testing connection...[/dim]")
         test_config(console, profile_name, config_path)
 
 
-def test_config(console: Console, profile_name: str, config_path: Path) -> None:
+def test_config(console: "Console", profile_name: str, config_path: Path) -> None:
     """Test a configuration profile."""
+    from mashell.config import load_config
+
     try:
         config = load_config(profile=profile_name, config_path=str(config_path))
 
@@ -181,12 +284,13 @@ def test_config(console: Console, profile_name: str, config_path: Path) -> None:
         )
 
         async def do_test() -> Response:
-            response = await provider.chat(
-                [Message(role="user", content="Say 'Hello from MaShell!' in exactly those words.")]
-            )
-            return response
+            try:
+                prompt = "Say 'Hello from MaShell!' in exactly those words."
+                return await provider.chat([Message(role="user", content=prompt)])
+            finally:
+                await provider.aclose()
 
-        response = asyncio.run(do_test())
+        response = _run_async(do_test())
 
         if response.content:
             console.print("\n[bold green]✅ Connection successful![/bold green]")
@@ -199,17 +303,39 @@ def test_config(console: Console, profile_name: str, config_path: Path) -> None:
         console.print("[dim]Please check your configuration and try again.[/dim]")
 
 
-def run_slack_init(console: Console) -> None:
+@functools.cache
+def _separator() -> "Text":
+    """Build the dim rule printed around resumed session context."""
+    from rich.text import Text
+
+    return Text("─" * 50, style="dim")
+
+
+def _step_header(number: int, title: str) -> "Text":
+    """Build a wizard step header without going through the markup parser."""
+    from rich.text import Text
+
+    return Text.assemble((f"Step {number}:", "bold"), f" {title}")
+
+
+def run_slack_init(console: "Console") -> None:
     """Interactive Slack configuration wizard."""
     import webbrowser
 
-    import yaml
+    from rich.prompt import Confirm, Prompt
+
+    from mashell.config import (
+        get_config_path,
+        load_config,
+        read_config_file,
+        write_config_file,
+    )
 
     console.print("\n[bold cyan]🤖 MaShell Slack Bot Setup Wizard[/bold cyan]\n")
     console.print("Let's set up your Slack bot integration.\n")
 
     # Step 1: Open Slack App creation page
-    console.print("[bold]Step 1:[/bold] Create a Slack App")
+    console.print(_step_header(1, "Create a Slack App"))
     console.print("  [dim]I'll open the Slack API page in your browser.[/dim]")
     console.print("  [dim]Click 'Create New App' → 'From scratch'[/dim]")
     console.print()
@@ -224,7 +350,7 @@ def run_slack_init(console: Console) -> None:
     console.print()
 
     # Step 2: Enable Socket Mode and get App Token
-    console.print("[bold]Step 2:[/bold] Enable Socket Mode & Get App Token")
+    console.print(_step_header(2, "Enable Socket Mode & Get App Token"))
     console.print("  [dim]In your Slack App settings:[/dim]")
     console.print("  [dim]1. Left sidebar → 'Socket Mode'[/dim]")
     console.print("  [dim]2. Toggle ON 'Enable Socket Mode'[/dim]")
@@ -238,7 +364,7 @@ def run_slack_init(console: Console) -> None:
     console.print("[green]✓[/green] App Token saved\n")
 
     # Step 3: Add Bot Permissions
-    console.print("[bold]Step 3:[/bold] Add Bot Permissions")
+    console.print(_step_header(3, "Add Bot Permissions"))
     console.print("  [dim]In your Slack App settings:[/dim]")
     console.print("  [dim]1. Left sidebar → 'OAuth & Permissions'[/dim]")
     console.print("  [dim]2. Scroll to 'Bot Token Scopes'[/dim]")
@@ -254,7 +380,7 @@ def run_slack_init(console: Console) -> None:
     console.print()
 
     # Step 4: Subscribe to Events
-    console.print("[bold]Step 4:[/bold] Subscribe to Events")
+    console.print(_step_header(4, "Subscribe to Events"))
     console.print("  [dim]1. Left sidebar → 'Event Subscriptions'[/dim]")
     console.print("  [dim]2. Toggle ON 'Enable Events'[/dim]")
     console.print("  [dim]3. Expand 'Subscribe to bot events'[/dim]")
@@ -269,7 +395,7 @@ def run_slack_init(console: Console) -> None:
     console.print()
 
     # Step 5: Install App and get Bot Token
-    console.print("[bold]Step 5:[/bold] Install App & Get Bot Token")
+    console.print(_step_header(5, "Install App & Get Bot Token"))
     console.print("  [dim]1. Left sidebar → 'Install App'[/dim]")
     console.print("  [dim]2. Click 'Install to Workspace'[/dim]")
     console.print("  [dim]3. Authorize the app[/dim]")
@@ -282,19 +408,18 @@ def run_slack_init(console: Console) -> None:
     console.print("[green]✓[/green] Bot Token saved\n")
 
     # Step 6: Configuration options
-    console.print("[bold]Step 6:[/bold] Bot Behavior")
+    console.print(_step_header(6, "Bot Behavior"))
     respond_to_mentions = Confirm.ask(
         "Only respond when @mentioned? (No = respond to all messages)", default=True
     )
     console.print()
 
     # Step 7: Select profile to add Slack config
-    console.print("[bold]Step 7:[/bold] Save Configuration")
+    console.print(_step_header(7, "Save Configuration"))
 
     config_path = get_config_path()
     if config_path.exists():
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = read_config_file(config_path)
     else:
         config_data = {}
 
@@ -329,8 +454,7 @@ def run_slack_init(console: Console) -> None:
 
     # Save config
     config_data["profiles"] = profiles
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+    write_config_file(config_path, config_data)
 
     console.print(
         f"\n[bold green]✅ Slack configuration saved to profile '{profile_name}'![/bold green]"
@@ -351,13 +475,7 @@ def run_slack_init(console: Console) -> None:
         run_slack_bot(config, agent, console)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="mashell",
-        description="🐚 MaShell - AI-powered command line assistant",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   mashell                                                         # Auto-starts setup if no config
   mashell init                                                    # Interactive setup wizard
@@ -366,127 +484,162 @@ Examples:
   mashell --provider ollama --url http://localhost:11434 --model qwen2.5:14b "list files"
   mashell --profile azure "refactor this code"
   mashell -y "update all packages"                                # auto-approve mode
-        """,
+        """
+
+# Command line arguments as (flags, add_argument kwargs)
+_ARG_SPECS: tuple[tuple[tuple[str, ...], dict[str, Any]], ...] = (
+    (
+        ("prompt",),
+        {
+            "nargs": "?",
+            "help": "Task prompt or command (use 'init' for setup, 'slack init' for Slack setup)",
+        },
+    ),
+    (("subcommand",), {"nargs": "?", "help": "Subcommand (e.g., 'init' after 'slack')"}),
+    # Provider settings
+    (("--provider",), {"help": "LLM provider (openai, azure, anthropic, ollama)"}),
+    (("--url",), {"help": "API endpoint URL"}),
+    (("--key",), {"help": "API key (not needed for local models)"}),
+    (("--model",), {"help": "Model name (or deployment name for Azure)"}),
+    # Config options
+    (("--profile",), {"help": "Use a saved profile from config file"}),
+    (("-c", "--config"), {"help": "Path to config file"}),
+    # Behavior options
+    (
+        ("-y", "--yes"),
+        {"action": "store_true", "help": "Auto-approve all commands (use with caution)"},
+    ),
+    (("-v", "--verbose"), {"action": "store_true", "help": "Enable verbose output"}),
+    (("--no-logo",), {"action": "store_true", "help": "Skip the startup logo"}),
+    (("--version",), {"action": "version", "version": f"%(prog)s {__version__}"}),
+    # Session management
+    (("-S", "--sessions"), {"action": "store_true", "help": "List all saved sessions"}),
+    (
+        ("-r", "--resume"),
+        {
+            "nargs": "?",
+            "const": "__MOST_RECENT__",
+            "metavar": "N",
+            "help": "Resume a session (most recent, or specify #N from list)",
+        },
+    ),
+    (("-s", "--session"), {"metavar": "NAME", "help": "Use or create a named session"}),
+    (
+        ("-n", "--new-session"),
+        {"action": "store_true", "help": "Force start a new session (don't resume)"},
+    ),
+    (("--delete-session",), {"metavar": "NAME", "help": "Delete a saved session"}),
+    (("--clear-sessions",), {"action": "store_true", "help": "Delete all saved sessions"}),
+    # Slack integration
+    (
+        ("--slack",),
+        {
+            "action": "store_true",
+            "help": "Start Slack bot mode (bidirectional communication)",
+        },
+    ),
+    (
+        ("--no-slack",),
+        {
+            "action": "store_true",
+            "help": "Disable auto Slack mode (use CLI even if Slack is configured)",
+        },
+    ),
+)
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once per process)."""
+    parser = argparse.ArgumentParser(
+        prog="mashell",
+        description="🐚 MaShell - AI-powered command line assistant",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
+    for flags, kwargs in _ARG_SPECS:
+        parser.add_argument(*flags, **kwargs)
+    return parser
 
-    parser.add_argument(
-        "prompt",
-        nargs="?",
-        help="Task prompt or command (use 'init' for setup, 'slack init' for Slack setup)",
-    )
 
-    parser.add_argument(
-        "subcommand",
-        nargs="?",
-        help="Subcommand (e.g., 'init' after 'slack')",
-    )
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
-    # Provider settings
-    parser.add_argument(
-        "--provider",
-        help="LLM provider (openai, azure, anthropic, ollama)",
-    )
-    parser.add_argument(
-        "--url",
-        help="API endpoint URL",
-    )
-    parser.add_argument(
-        "--key",
-        help="API key (not needed for local models)",
-    )
-    parser.add_argument(
-        "--model",
-        help="Model name (or deployment name for Azure)",
-    )
 
-    # Config options
-    parser.add_argument(
-        "--profile",
-        help="Use a saved profile from config file",
-    )
-    parser.add_argument(
-        "-c",
-        "--config",
-        help="Path to config file",
-    )
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
 
-    # Behavior options
-    parser.add_argument(
-        "-y",
-        "--yes",
-        action="store_true",
-        help="Auto-approve all commands (use with caution)",
-    )
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="store_true",
-        help="Enable verbose output",
-    )
-    parser.add_argument(
-        "--no-logo",
-        action="store_true",
-        help="Skip the startup logo",
-    )
 
-    # Session management
-    parser.add_argument(
-        "-S",
-        "--sessions",
-        action="store_true",
-        help="List all saved sessions",
-    )
-    parser.add_argument(
-        "-r",
-        "--resume",
-        nargs="?",
-        const="__MOST_RECENT__",
-        metavar="N",
-        help="Resume a session (most recent, or specify #N from list)",
-    )
-    parser.add_argument(
-        "-s",
-        "--session",
-        metavar="NAME",
-        help="Use or create a named session",
-    )
-    parser.add_argument(
-        "-n",
-        "--new-session",
-        action="store_true",
-        help="Force start a new session (don't resume)",
-    )
-    parser.add_argument(
-        "--delete-session",
-        metavar="NAME",
-        help="Delete a saved session",
-    )
-    parser.add_argument(
-        "--clear-sessions",
-        action="store_true",
-        help="Delete all saved sessions",
-    )
+def _time_ago(seconds: int) -> str:
+    """Convert an age in seconds to human-readable 'time ago'."""
+    days = seconds // _DAY
+    if days > 7:
+        return f"{days // 7}w ago"
+    elif days > 0:
+        return f"{days}d ago"
+    elif seconds > _HOUR:
+        return f"{seconds // _HOUR}h ago"
+    elif seconds > _MINUTE:
+        return f"{seconds // _MINUTE}m ago"
+    else:
+        return "just now"
 
-    # Slack integration
-    parser.add_argument(
-        "--slack",
-        action="store_true",
-        help="Start Slack bot mode (bidirectional communication)",
-    )
-    parser.add_argument(
-        "--no-slack",
-        action="store_true",
-        help="Disable auto Slack mode (use CLI even if Slack is configured)",
-    )
 
-    return parser.parse_args()
+def _last_active(updated: str, now: "datetime") -> str:
+    """Format an ISO timestamp as a relative age, or "unknown" if unparseable."""
+    from datetime import datetime
 
+    try:
+        return _time_ago(int((now - datetime.fromisoformat(updated)).total_seconds()))
+    except (ValueError, TypeError):
+        return "unknown"
 
-def show_sessions_list(console: Console, session_mgr: SessionManager) -> list:
-    """Display a table of all saved sessions. Returns list of sessions."""
-    from datetime import datetime
 
+def _trunc(text: str, width: int) -> str:
+    """Truncate text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _sorted_sessions(session_mgr: "SessionManager") -> "list[SessionData]":
+    """List saved sessions, most recent first."""
     sessions = session_mgr.list_sessions()
+    sessions.sort(key=lambda s: s.updated, reverse=True)
+    return sessions
+
+
+def _do_resume(
+    console: "Console", session: "SessionData", show_task: bool = False, hint: bool = False
+) -> str:
+    """Announce an already-loaded session as resumed and return its name."""
+    from rich.text import Text
+
+    console.print(Text.assemble(("✓", "green"), " Resuming session: ", (session.name, "bold")))
+    if show_task and session.original_task:
+        console.print(f"[dim]   Task: {_trunc(session.original_task, 60)}[/dim]")
+    if hint:
+        console.print("[dim]   (Use --new or -n to start a new session)[/dim]")
+    console.print()
+    return session.name
+
+
+def show_sessions_list(
+    console: "Console",
+    session_mgr: "SessionManager",
+    sessions: "list[SessionData] | None" = None,
+) -> list:
+    """
+    Display a table of all saved sessions. Returns list of sessions.
+
+    Pass sessions (sorted most recent first) to reuse an existing listing.
+    """
+    from datetime import datetime
+
+    from rich.table import Table
+
+    if sessions is None:
+        sessions = _sorted_sessions(session_mgr)
 
     if not sessions:
         console.print("[dim]No saved sessions found.[/dim]")
@@ -494,44 +647,24 @@ def show_sessions_list(console: Console, session_mgr: SessionManager) -> list:
         console.print('  [cyan]mashell -s my-project "your task here"[/cyan]')
         return []
 
-    # Sort by updated time, most recent first
-    sessions.sort(key=lambda s: s.updated, reverse=True)
-
     table = Table(title="🗂️  Saved Sessions", show_header=True, header_style="bold cyan")
     table.add_column("#", style="dim", width=3)
     table.add_column("Name", style="bold")
     table.add_column("Last Active", style="dim")
     table.add_column("Task", max_width=40)
 
-    def time_ago(iso_time: str) -> str:
-        """Convert ISO time to human-readable 'time ago'."""
-        try:
-            dt = datetime.fromisoformat(iso_time)
-            delta = datetime.now() - dt
-
-            if delta.days > 7:
-                return f"{delta.days // 7}w ago"
-            elif delta.days > 0:
-                return f"{delta.days}d ago"
-            elif delta.seconds > 3600:
-                return f"{delta.seconds // 3600}h ago"
-            elif delta.seconds > 60:
-                return f"{delta.seconds // 60}m ago"
-            else:
-                return "just now"
-        except (ValueError, TypeError):
-            return "unknown"
-
-    for i, sess in enumerate(sessions, 1):
-        task = sess.original_task or "[no task]"
-        if len(task) > 37:
-            task = task[:37] + "..."
-        table.add_row(
+    now = datetime.now()
+    rows = [
+        (
             str(i),
             sess.name,
-            time_ago(sess.updated),
-            task,
+            _last_active(sess.updated, now),
+            _trunc(sess.original_task or "[no task]", 37),
         )
+        for i, sess in enumerate(sessions, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print()
@@ -543,7 +676,7 @@ def show_sessions_list(console: Console, session_mgr: SessionManager) -> list:
     return sessions
 
 
-def run_slack_bot(config: Config, agent: Agent, console: Console) -> None:
+def run_slack_bot(config: "Config", agent: "Agent", console: "Console") -> None:
     """Run MaShell as a Slack bot with bidirectional communication."""
     if not config.slack:
         console.print("[red]❌ Slack configuration not found![/red]")
@@ -577,32 +710,42 @@ def run_slack_bot(config: Config, agent: Agent, console: Console) -> None:
     bot.start()
 
 
+@functools.cache
+def _history_file() -> Path:
+    """Get the interactive history file path, creating its directory once."""
+    history_dir = Path.home() / ".mashell"
+    history_dir.mkdir(exist_ok=True)
+    return history_dir / "history"
+
+
 async def interactive_loop(
-    agent: Agent,
-    console: Console,
-    session_mgr: SessionManager | None = None,
+    agent: "Agent",
+    console: "Console",
+    session_mgr: "SessionManager | None" = None,
 ) -> None:
     """Run interactive conversation loop."""
-    from pathlib import Path
+    import asyncio
 
     from prompt_toolkit import PromptSession
     from prompt_toolkit.history import FileHistory
 
-    # Setup history file
-    history_dir = Path.home() / ".mashell"
-    history_dir.mkdir(exist_ok=True)
-    history_file = history_dir / "history"
-
-    prompt_session: PromptSession[str] = PromptSession(history=FileHistory(str(history_file)))
+    prompt_session: PromptSession[str] = PromptSession(history=FileHistory(str(_history_file())))
 
     console.print("[dim]Interactive mode. Type 'exit' or 'quit' to exit.[/dim]")
     console.print()
 
+    # The previous turn's session save runs in a thread while the next line is typed
+    pending_save: asyncio.Future[None] | None = None
+
+    async def finish_save() -> None:
+        nonlocal pending_save
+        if pending_save is not None:
+            await pending_save
+            pending_save = None
+
     while True:
         try:
-            user_input = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: prompt_session.prompt("You: ")
-            )
+            user_input = await prompt_session.prompt_async("You: ")
 
             user_input = user_input.strip()
 
@@ -613,11 +756,15 @@ async def interactive_loop(
                 console.print("[dim]Goodbye![/dim]")
                 break
 
+            # The agent mutates the context, so the last save must finish first
+            await finish_save()
             await agent.run(user_input)
 
             # Save session after each turn
             if session_mgr:
-                session_mgr.update_from_context(agent.context, user_input)
+                pending_save = asyncio.ensure_future(
+                    asyncio.to_thread(session_mgr.update_from_context, agent.context, user_input)
+                )
 
             console.print()
 
@@ -627,16 +774,52 @@ async def interactive_loop(
             console.print("\n[dim]Goodbye![/dim]")
             break
 
+    await finish_save()
+
+
+def _display_logo(console: "Console") -> None:
+    """Display the static logo, importing it only when shown."""
+    from mashell.logo import display_logo
+
+    display_logo(console, animate=False)
+
+
+def _create_console() -> "Console":
+    """Create the CLI console, plain when output is not a terminal."""
+    from rich.console import Console
+
+    if sys.stdout.isatty():
+        # The repr highlighter regex-scans every print; our output is styled explicitly
+        return Console(highlight=False)
+    # Piped or CI output: skip color, highlighting and hard wrapping entirely
+    return Console(no_color=True, highlight=False, soft_wrap=True)
+
 
 def main() -> None:
     """Main entry point."""
-    console = Console()
-    args = parse_args()
+    # Bare `mashell init` and `mashell -S` need no argument parsing
+    argv = sys.argv[1:]
+    if argv == ["init"]:
+        console = _create_console()
+        _display_logo(console)
+        run_init(console)
+        return
+    if argv in (["-S"], ["--sessions"]):
+        from mashell.session import SessionManager
 
-    # Initialize session manager
-    session_mgr = SessionManager()
+        show_sessions_list(_create_console(), SessionManager())
+        return
+
+    # --help and --version exit inside argparse, before anything heavy is loaded
+    args = parse_args()
+    console = _create_console()
 
     # Handle session management commands (don't need config)
+    if args.sessions or args.delete_session or args.clear_sessions:
+        from mashell.session import SessionManager
+
+        session_mgr = SessionManager()
+
     if args.sessions:
         show_sessions_list(console, session_mgr)
         return
@@ -649,6 +832,8 @@ def main() -> None:
         return
 
     if args.clear_sessions:
+        from rich.prompt import Confirm
+
         if Confirm.ask("[yellow]Delete all sessions?[/yellow]", default=False):
             count = session_mgr.clear_all()
             console.print(f"[green]✓[/green] Deleted {count} session(s)")
@@ -657,18 +842,26 @@ def main() -> None:
     # Handle explicit init command
     if args.prompt == "init":
         if not args.no_logo:
-            display_logo(console, animate=False)
+            _display_logo(console)
         run_init(console)
         return
 
     # Handle slack init command
     if args.prompt == "slack" and args.subcommand == "init":
         if not args.no_logo:
-            display_logo(console, animate=False)
+            _display_logo(console)
         run_slack_init(console)
         return
 
+    from mashell.agent.core import Agent
+    from mashell.config import get_config_path, load_config
+    from mashell.session import SessionData, SessionManager
+
+    # Initialize session manager
+    session_mgr = SessionManager()
+
     # Try to load config, auto-start onboarding if no config exists
+    config_path = get_config_path()
     try:
         config = load_config(
             provider=args.provider,
@@ -682,13 +875,12 @@ def main() -> None:
         )
     except ValueError as e:
         # No config provided - check if this is first run
-        config_path = get_config_path()
-        has_no_cli_args = not any([args.provider, args.url, args.model, args.profile])
+        has_no_cli_args = not (args.provider or args.url or args.model or args.profile)
 
         if has_no_cli_args and not config_path.exists():
             # First time user - start onboarding
             if not args.no_logo:
-                display_logo(console, animate=False)
+                _display_logo(console)
             console.print("[yellow]No configuration found.[/yellow] Let's set up MaShell!\n")
             run_init(console)
             return
@@ -707,26 +899,25 @@ def main() -> None:
 
     # Display logo
     if not args.no_logo:
-        display_logo(console, animate=False)
+        _display_logo(console)
 
     # Handle session resume
     session_name: str | None = None
-    resume_prompt: str | None = None
+    resumed = False
+
+    @functools.cache
+    def get_sessions() -> list[SessionData]:
+        """List saved sessions once per run, most recent first."""
+        return _sorted_sessions(session_mgr)
 
     if args.resume:
         if args.resume == "__MOST_RECENT__":
             # Resume most recent session
-            session = session_mgr.load_most_recent()
+            sessions = get_sessions()
+            session = session_mgr.activate(sessions[0]) if sessions else None
             if session:
-                session_name = session.name
-                resume_prompt = session_mgr.get_resume_prompt()
-                console.print(f"[green]✓[/green] Resuming session: [bold]{session.name}[/bold]")
-                if session.original_task:
-                    task_preview = session.original_task[:60]
-                    if len(session.original_task) > 60:
-                        task_preview += "..."
-                    console.print(f"[dim]  Task: {task_preview}[/dim]")
-                console.print()
+                session_name = _do_resume(console, session, show_task=True)
+                resumed = True
             else:
                 console.print("[yellow]No sessions to resume.[/yellow]")
                 console.print("[dim]Starting new session...[/dim]")
@@ -735,32 +926,25 @@ def main() -> None:
             # Resume by number
             try:
                 idx = int(args.resume) - 1
-                sessions = session_mgr.list_sessions()
-                sessions.sort(key=lambda s: s.updated, reverse=True)
+                sessions = get_sessions()
                 if 0 <= idx < len(sessions):
-                    session = session_mgr.load(sessions[idx].name)
+                    session = session_mgr.activate(sessions[idx])
                     if session:
-                        session_name = session.name
-                        resume_prompt = session_mgr.get_resume_prompt()
-                        console.print(
-                            f"[green]✓[/green] Resuming session: [bold]{session.name}[/bold]"
-                        )
-                        console.print()
+                        session_name = _do_resume(console, session)
+                        resumed = True
                 else:
                     console.print(f"[red]Invalid session number:[/red] {args.resume}")
-                    show_sessions_list(console, session_mgr)
+                    show_sessions_list(console, session_mgr, sessions)
                     return
             except ValueError:
                 # Treat as session name
                 session = session_mgr.load(args.resume)
                 if session:
-                    session_name = session.name
-                    resume_prompt = session_mgr.get_resume_prompt()
-                    console.print(f"[green]✓[/green] Resuming session: [bold]{session.name}[/bold]")
-                    console.print()
+                    session_name = _do_resume(console, session)
+                    resumed = True
                 else:
                     console.print(f"[yellow]Session not found:[/yellow] {args.resume}")
-                    show_sessions_list(console, session_mgr)
+                    show_sessions_list(console, session_mgr, get_sessions())
                     return
 
     elif args.session:
@@ -768,43 +952,24 @@ def main() -> None:
         session_name = args.session
         session = session_mgr.load(session_name)
         if session:
-            resume_prompt = session_mgr.get_resume_prompt()
-            console.print(f"[green]✓[/green] Resuming session: [bold]{session_name}[/bold]")
-            console.print()
+            _do_resume(console, session)
+            resumed = True
         else:
             session_mgr.create(name=session_name)
             console.print(f"[green]✓[/green] Created new session: [bold]{session_name}[/bold]")
             console.print()
 
     elif not args.new_session:
-        # Check if there's a recent session to resume
-        sessions = session_mgr.list_sessions()
-        recent_session = None
-
-        if sessions:
-            # Find the most recent session with actual content
-            sessions.sort(key=lambda s: s.updated, reverse=True)
-            for sess in sessions:
-                if sess.original_task:  # Has a task = has content worth resuming
-                    recent_session = sess
-                    break
+        # Auto-resume the most recent session with a task (reading newest first,
+        # so the scan stops at the first match instead of loading every session)
+        recent_session = next((s for s in session_mgr.iter_recent() if s.original_task), None)
 
         if recent_session:
             # Auto-resume the most recent session
-            session = session_mgr.load(recent_session.name)
+            session = session_mgr.activate(recent_session)
             if session:
-                session_name = session.name
-                resume_prompt = session_mgr.get_resume_prompt()
-
-                task_preview = session.original_task or ""
-                if len(task_preview) > 60:
-                    task_preview = task_preview[:60] + "..."
-
-                console.print(f"[green]✓[/green] Resuming session: [bold]{session.name}[/bold]")
-                if task_preview:
-                    console.print(f"[dim]   Task: {task_preview}[/dim]")
-                console.print("[dim]   (Use --new or -n to start a new session)[/dim]")
-                console.print()
+                session_name = _do_resume(console, session, show_task=True, hint=True)
+                resumed = True
         else:
             # No previous sessions - just create default
             session_name = "default"
@@ -854,22 +1019,27 @@ def main() -> None:
     # Run
     if args.prompt and args.prompt != "slack":
         # Single prompt mode (exclude "slack" as it might be leftover from "slack init")
-        asyncio.run(agent.run(args.prompt))
+        _run_async(agent.run(args.prompt))
         # Save session after single prompt
         session_mgr.update_from_context(agent.context, args.prompt)
-    elif resume_prompt and not args.prompt:
-        # Resuming - show what we're continuing
-        console.print("[dim]─" * 50 + "[/dim]")
-        console.print("[bold cyan]📋 Session Context:[/bold cyan]")
-        for line in resume_prompt.split("\n")[:8]:  # Show first 8 lines
-            console.print(f"[dim]  {line}[/dim]")
-        console.print("[dim]─" * 50 + "[/dim]")
+    elif resumed and not args.prompt and (resume_prompt := session_mgr.get_resume_prompt()):
+        # Resuming - show what we're continuing (prompt built only when shown)
+        from rich.text import Text
+
+        context_lines = resume_prompt.split("\n")[:8]  # Show first 8 lines
+        console.print(_separator())
+        console.print(Text("📋 Session Context:", style="bold cyan"))
+        console.print(Text("\n".join(f"  {line}" for line in context_lines), style="dim"))
+        console.print(_separator())
         console.print()
         # Enter interactive mode
-        asyncio.run(interactive_loop(agent, console, session_mgr))
+        _run_async(interactive_loop(agent, console, session_mgr))
     else:
         # Interactive mode
-        asyncio.run(interactive_loop(agent, console, session_mgr))
+        _run_async(interactive_loop(agent, console, session_mgr))
+
+    # Close pooled provider connections before the event loop shuts down
+    _run_async(agent.provider.aclose())
 
 
 if __name__ == "__main__":
@@ -1,15 +1,29 @@
 """Configuration loading and management."""
 
+import copy
+import functools
 import os
 import platform
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from mashell.jsonlib import dumps, loads
 
-@dataclass
+# Prefer the LibYAML C bindings, which parse and emit several times faster
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
 class ProviderConfig:
     """LLM provider configuration."""
 
@@ -19,7 +33,7 @@ class ProviderConfig:
     model: str  # Model/deployment name
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionConfig:
     """Permission rules configuration."""
 
@@ -27,7 +41,7 @@ class PermissionConfig:
     always_ask: list[str] = field(default_factory=lambda: ["shell", "run_background"])
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackConfig:
     """Slack integration configuration."""
 
@@ -38,7 +52,7 @@ class SlackConfig:
     allowed_users: list[str] = field(default_factory=list)  # Empty = all users
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration."""
 
@@ -48,13 +62,143 @@ class Config:
     auto_approve_all: bool = False
     working_dir: str = field(default_factory=os.getcwd)
     slack: SlackConfig | None = None  # Optional Slack integration
+    context_budget: int = 32000  # Max estimated tokens sent to the LLM per call
+    response_cache: bool = False  # Persist text replies to reuse for identical requests
 
     @property
     def system_info(self) -> str:
         """Get current system information."""
-        return f"{platform.system()} {platform.release()}"
+        return _system_info()
+
+
+@functools.cache
+def _system_info() -> str:
+    """Describe the OS once per process; it cannot change while we run."""
+    return f"{platform.system()} {platform.release()}"
+
+
+# A config value that is entirely a ${VAR} reference to an environment variable
+_ENV_REF = re.compile(r"\$\{([^}]+)\}")
+
+
+def _expand_env(value: Any, env: dict[str, str | None], default: str | None = None) -> Any:
+    """Resolve a ${VAR} config value from the environment, passing other values through."""
+    if isinstance(value, str) and (match := _ENV_REF.fullmatch(value)):
+        # env holds the lookups already made while loading this profile
+        name = match.group(1)
+        if name not in env:
+            env[name] = os.environ.get(name)
+        resolved = env[name]
+        return default if resolved is None else resolved
+    return value
+
+
+# Parsed YAML files keyed by (path, mtime, size), so edits invalidate entries
+_YAML_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_YAML_CACHE_SIZE = 32
 
 
+def read_config_file(path: Path) -> dict[str, Any]:
+    """Parse a YAML config file, reusing the result while the file is unchanged."""
+    # Callers may mutate the result before writing it back
+    return copy.deepcopy(_parse_config_file(path))
+
+
+def _parse_config_file(path: Path) -> dict[str, Any]:
+    """Get the cached parse of a YAML config file. The result is shared; do not mutate it."""
+    stat = path.stat()
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    data = _YAML_CACHE.get(cache_key)
+    if data is None:
+        data = _read_sidecar(path, stat)
+        if data is None:
+            with open(path) as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+            _write_sidecar(path, stat, data)
+        _YAML_CACHE[cache_key] = data
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    else:
+        _YAML_CACHE.move_to_end(cache_key)
+    return data
+
+
+def _read_config_if_exists(path: Path) -> dict[str, Any] | None:
+    """Parse a YAML config file, or return None if it does not exist."""
+    # read_config_file() stats the file anyway, so no separate exists() check
+    try:
+        return read_config_file(path)
+    except FileNotFoundError:
+        return None
+
+
+def write_config_file(path: Path, data: dict[str, Any]) -> None:
+    """Write a YAML config file atomically, skipping the write if nothing changed."""
+    content = yaml.dump(
+        data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True
+    ).encode()
+
+    # Leaving an identical file untouched also keeps its read_config_file entry valid
+    try:
+        if path.read_bytes() == content:
+            return
+        # The file holds API keys; the replacement must keep e.g. a 0600 mode
+        mode: int | None = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    _atomic_write(path, content, mode)
+    _write_sidecar(path, path.stat(), data)
+
+
+def _atomic_write(path: Path, content: bytes, mode: int | None = None) -> None:
+    """Write a file via a temp file and rename, with the given mode (default: umask)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)  # A stale temp file would keep its old mode
+    # With an explicit mode, start owner-only so the content is never more exposed
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if mode is None else 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    if mode is not None:
+        os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Get the JSON sidecar path for a YAML config file."""
+    return path.with_name(f".{path.name}.json")
+
+
+def _read_sidecar(path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+    """Load parsed config from the JSON sidecar if it matches the YAML file."""
+    try:
+        sidecar = loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    # The sidecar records the YAML file it was made from; any edit invalidates it
+    if sidecar.get("mtime_ns") != stat.st_mtime_ns or sidecar.get("size") != stat.st_size:
+        return None
+    data: dict[str, Any] = sidecar.get("data") or {}
+    return data
+
+
+def _write_sidecar(path: Path, stat: os.stat_result, data: dict[str, Any]) -> None:
+    """Save parsed config as JSON so later runs can skip the YAML parse."""
+    sidecar = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data}
+    try:
+        content = dumps(sidecar)
+        # YAML allows non-string keys, dates and more; only cache what JSON returns intact
+        if loads(content)["data"] != data:
+            return
+        # The config holds API keys, so the cached copy is readable by the owner only
+        _atomic_write(_sidecar_path(path), content, 0o600)
+    except (OSError, TypeError, ValueError):
+        pass  # The sidecar is only a cache
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the default config file path."""
     return Path.home() / ".mashell" / "config.yaml"
@@ -74,10 +218,10 @@ def save_last_profile(profile_name: str) -> None:
 
 def get_last_profile() -> str | None:
     """Get the last used profile name, or None if not set."""
-    path = get_last_profile_path()
-    if path.exists():
-        return path.read_text().strip()
-    return None
+    try:
+        return get_last_profile_path().read_text().strip()
+    except FileNotFoundError:
+        return None
 
 
 def load_default_permissions() -> PermissionConfig:
@@ -92,38 +236,52 @@ def load_from_profile(profile_name: str, config_path: str | None = None) -> Conf
     """Load configuration from a named profile."""
     path = Path(config_path) if config_path else get_config_path()
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    try:
+        data = read_config_file(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+
+    return _build_from_profile_data(data, profile_name)
+
 
-    with open(path) as f:
-        data = yaml.safe_load(f)
+# Profile fields that must resolve to a value, with their display names
+_REQUIRED_FIELDS = {"provider": "Provider", "url": "URL", "model": "Model"}
 
+
+def _build_from_profile_data(data: dict[str, Any], profile_name: str) -> Config:
+    """Build configuration from a named profile in already-parsed config data."""
     profiles = data.get("profiles", {})
     if profile_name not in profiles:
         raise ValueError(f"Profile '{profile_name}' not found in config")
 
     profile = profiles[profile_name]
 
-    # Expand environment variables in key
-    key = profile.get("key")
-    if key and key.startswith("${") and key.endswith("}"):
-        env_var = key[2:-1]
-        key = os.getenv(env_var)
+    # Expand ${VAR} references in the provider fields
+    env: dict[str, str | None] = {}
+    required = {name: _expand_env(profile[name], env) for name in _REQUIRED_FIELDS}
+    for name, value in required.items():
+        if value is None:
+            ref = _ENV_REF.fullmatch(profile[name]) if isinstance(profile[name], str) else None
+            fix = f"Set {ref.group(1)}" if ref else f"Add it to profile '{profile_name}'"
+            raise ValueError(f"{_REQUIRED_FIELDS[name]} is required. {fix}")
+    key = _expand_env(profile.get("key"), env)
 
     # Load Slack config if present
-    slack_config = _load_slack_config(profile.get("slack"))
+    slack_config = _load_slack_config(profile.get("slack"), env)
 
     return Config(
         provider=ProviderConfig(
-            provider=profile["provider"],
-            url=profile["url"],
+            provider=required["provider"],
+            url=required["url"],
             key=key,
-            model=profile["model"],
+            model=required["model"],
         ),
         permissions=_load_permissions_from_data(data),
         verbose=False,
         auto_approve_all=False,
         slack=slack_config,
+        context_budget=profile.get("context_budget", 32000),
+        response_cache=profile.get("response_cache", False),
     )
 
 
@@ -136,19 +294,16 @@ def _load_permissions_from_data(data: dict[str, Any]) -> PermissionConfig:
     )
 
 
-def _load_slack_config(slack_data: dict[str, Any] | None) -> SlackConfig | None:
+def _load_slack_config(
+    slack_data: dict[str, Any] | None, env: dict[str, str | None]
+) -> SlackConfig | None:
     """Load Slack configuration from profile data."""
     if not slack_data:
         return None
 
     # Support environment variables for tokens
-    bot_token = slack_data.get("bot_token", "")
-    if bot_token.startswith("${") and bot_token.endswith("}"):
-        bot_token = os.getenv(bot_token[2:-1], "")
-
-    app_token = slack_data.get("app_token", "")
-    if app_token.startswith("${") and app_token.endswith("}"):
-        app_token = os.getenv(app_token[2:-1], "")
+    bot_token = _expand_env(slack_data.get("bot_token", ""), env, "")
+    app_token = _expand_env(slack_data.get("app_token", ""), env, "")
 
     if not bot_token or not app_token:
         return None
@@ -186,23 +341,23 @@ def load_config(
         return config
 
     # Build from CLI args / env vars
-    resolved_provider = provider or os.getenv("MASHELL_PROVIDER")
-    resolved_url = url or os.getenv("MASHELL_URL")
-    resolved_key = key or os.getenv("MASHELL_KEY")
-    resolved_model = model or os.getenv("MASHELL_MODEL")
+    env = os.environ
+    resolved_provider = provider or env.get("MASHELL_PROVIDER")
+    resolved_url = url or env.get("MASHELL_URL")
+    resolved_key = key or env.get("MASHELL_KEY")
+    resolved_model = model or env.get("MASHELL_MODEL")
 
     # If no CLI args or env vars, try to auto-load from config file
     if not any([resolved_provider, resolved_url, resolved_model]):
         path = Path(config_path) if config_path else get_config_path()
-        if path.exists():
-            with open(path) as f:
-                data = yaml.safe_load(f)
+        data = _read_config_if_exists(path)
+        if data is not None:
             profiles = data.get("profiles", {})
 
             if len(profiles) == 1:
                 # Auto-select the only profile
                 profile_name = list(profiles.keys())[0]
-                config = load_from_profile(profile_name, config_path)
+                config = _build_from_profile_data(data, profile_name)
                 config.verbose = verbose
                 config.auto_approve_all = auto_approve_all
                 save_last_profile(profile_name)
@@ -211,7 +366,7 @@ def load_config(
                 # Multiple profiles - try to use last used profile
                 last_profile = get_last_profile()
                 if last_profile and last_profile in profiles:
-                    config = load_from_profile(last_profile, config_path)
+                    config = _build_from_profile_data(data, last_profile)
                     config.verbose = verbose
                     config.auto_approve_all = auto_approve_all
                     return config
@@ -246,12 +401,17 @@ def add_auto_approve_tool(tool_name: str, config_path: str | None = None) -> Non
     """Add a tool to the auto_approve list in config file."""
     path = Path(config_path) if config_path else get_config_path()
 
-    # Load existing config or create new
-    if path.exists():
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-    else:
-        data = {}
+    try:
+        cached = _parse_config_file(path)
+    except FileNotFoundError:
+        cached = {}
+
+    # Already listed: skip the copy and the write entirely
+    if tool_name in cached.get("permissions", {}).get("auto_approve", []):
+        return
+
+    # Copy the existing config (or start a new one) before modifying it
+    data = copy.deepcopy(cached)
 
     # Ensure permissions section exists
     if "permissions" not in data:
@@ -268,5 +428,4 @@ def add_auto_approve_tool(tool_name: str, config_path: str | None = None) -> Non
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save back to file
-        with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+        write_config_file(path, data)
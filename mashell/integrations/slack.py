@@ -300,6 +300,8 @@ class SlackBot:
             finally:
                 # Restore original UI
                 self.agent.permissions.ui = original_ui
+                # This event loop ends with the message, so release its connections
+                await self.agent.provider.aclose()
 
             if response:
                 # Split long messages (Slack limit is 4000 chars)
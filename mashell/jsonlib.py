@@ -0,0 +1,33 @@
+"""JSON encoding and decoding helpers, using orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj, sort_keys=sort_keys, default=str, ensure_ascii=False, indent=2 if indent else None
+    ).encode()
+
+
+def dumps_str(obj: Any) -> str:
+    """Encode an object as a JSON string."""
+    return dumps(obj).decode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or a string."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,5 +1,8 @@
 """ASCII art logo display."""
 
+import functools
+import io
+
 from rich.console import Console
 from rich.text import Text
 
@@ -15,13 +18,28 @@ LOGO = r"""
 TAGLINE = "🐴 Your AI-Powered Command Line Assistant"
 
 
+@functools.lru_cache(maxsize=4)
+def _render_logo(color_system: str | None) -> str:
+    """Render the logo to a string (cached per color system)."""
+    buffer = io.StringIO()
+    console = Console(
+        file=buffer,
+        color_system=color_system,  # type: ignore[arg-type]
+        force_terminal=color_system is not None,
+        width=80,
+    )
+    console.print()
+    console.print(Text(LOGO, style="bold cyan"))
+    console.print(f"  {TAGLINE}", style="dim")
+    console.print()
+    return buffer.getvalue()
+
+
 def display_logo(console: Console | None = None, animate: bool = True) -> None:
     """Display the MaShell logo."""
     if console is None:
         console = Console()
 
-    console.print()
-    logo_text = Text(LOGO, style="bold cyan")
-    console.print(logo_text)
-    console.print(f"  {TAGLINE}", style="dim")
-    console.print()
+    # The logo is static, so write pre-rendered text instead of re-styling it each time
+    console.file.write(_render_logo(console.color_system))
+    console.file.flush()
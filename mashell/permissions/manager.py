@@ -1,11 +1,25 @@
 """Permission manager."""
 
+import hashlib
+import re
+import time
 from dataclasses import dataclass
 from typing import Any
 
 from mashell.config import PermissionConfig, add_auto_approve_tool
+from mashell.jsonlib import dumps
 from mashell.permissions.ui import PermissionUI
 
+# Shell approvals are only reused for commands built from these read-only programs
+_READ_ONLY_COMMANDS = frozenset(
+    {"cat", "cut", "df", "diff", "du", "echo", "file", "grep", "head", "ls", "pwd"}
+    | {"stat", "tail", "wc", "which", "whoami"}
+)
+_READ_ONLY_GIT = frozenset({"diff", "log", "show", "status"})
+_COMMAND_SEPARATOR = re.compile(r"\|\|?|&&?|;|\n")
+# Redirection, substitution and options that make otherwise read-only programs write
+_WRITES_OR_SUBSTITUTES = re.compile(r"[<>`]|\$\(|--output|--ext-diff")
+
 
 @dataclass
 class PermissionRequest:
@@ -14,6 +28,7 @@ class PermissionRequest:
     tool_name: str
     arguments: dict[str, Any]
     description: str
+    cacheable: bool = True  # Approval may be reused for identical calls
 
 
 @dataclass
@@ -32,10 +47,13 @@ class PermissionManager:
         self,
         config: PermissionConfig,
         auto_approve_all: bool = False,
+        approval_ttl: float = 60.0,
     ) -> None:
         self.config = config
         self.auto_approve_all = auto_approve_all
         self.session_approved: set[str] = set()  # Tools approved for session
+        self.approval_ttl = approval_ttl  # seconds
+        self._approval_cache: dict[str, float] = {}  # Call hash -> expiry time
         self.ui = PermissionUI()
 
     async def check(self, request: PermissionRequest) -> PermissionResult:
@@ -52,9 +70,22 @@ class PermissionManager:
         if request.tool_name in self.session_approved:
             return PermissionResult(approved=True)
 
+        # Check if this exact call was approved moments ago
+        key = self._approval_key(request) if self._is_cacheable(request) else None
+        if key is not None:
+            expiry = self._approval_cache.get(key)
+            if expiry is not None:
+                if expiry > time.monotonic():
+                    return PermissionResult(approved=True)
+                del self._approval_cache[key]
+
         # Prompt user
         result = await self.ui.prompt(request)
 
+        # Cache approvals of the call as requested, not edited versions
+        if key is not None and result.approved and not result.modified_args:
+            self._approval_cache[key] = time.monotonic() + self.approval_ttl
+
         # Remember if user said "always"
         if result.remember and result.approved:
             self.session_approved.add(request.tool_name)
@@ -65,3 +96,37 @@ class PermissionManager:
                 pass  # Silently fail if can't write config
 
         return result
+
+    def revoke_approvals(self) -> int:
+        """Forget cached per-call approvals. Returns count of revoked entries."""
+        count = len(self._approval_cache)
+        self._approval_cache.clear()
+        return count
+
+    def _is_cacheable(self, request: PermissionRequest) -> bool:
+        """Check if an approval for this request may be reused."""
+        if not request.cacheable:
+            return False
+        command = request.arguments.get("command")
+        return not isinstance(command, str) or _is_read_only_command(command)
+
+    def _approval_key(self, request: PermissionRequest) -> str:
+        """Get a stable hash identifying a tool call."""
+        call = [request.tool_name, request.arguments]
+        return hashlib.blake2b(dumps(call, sort_keys=True), digest_size=16).hexdigest()
+
+
+def _is_read_only_command(command: str) -> bool:
+    """Check if every part of a shell command runs a known read-only program."""
+    if _WRITES_OR_SUBSTITUTES.search(command):
+        return False
+    for part in _COMMAND_SEPARATOR.split(command):
+        words = part.split()
+        if not words:
+            continue
+        if words[0] == "git":
+            if len(words) < 2 or words[1] not in _READ_ONLY_GIT:
+                return False
+        elif words[0] not in _READ_ONLY_COMMANDS:
+            return False
+    return True
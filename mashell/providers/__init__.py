@@ -1,34 +1,52 @@
 """Providers package - LLM provider implementations."""
 
-from mashell.providers.anthropic import AnthropicProvider
-from mashell.providers.azure import AzureProvider
-from mashell.providers.base import BaseProvider, Message, Response, ToolCall
-from mashell.providers.ollama import OllamaProvider
-from mashell.providers.openai import OpenAIProvider
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from mashell.providers.base import BaseProvider, ChatDelta, Message, Response, ToolCall
+
+if TYPE_CHECKING:
+    from mashell.providers.anthropic import AnthropicProvider
+    from mashell.providers.azure import AzureProvider
+    from mashell.providers.ollama import OllamaProvider
+    from mashell.providers.openai import OpenAIProvider
 
 __all__ = [
     "BaseProvider",
     "Message",
     "ToolCall",
     "Response",
+    "ChatDelta",
     "OpenAIProvider",
     "AzureProvider",
     "AnthropicProvider",
     "OllamaProvider",
 ]
 
+# Provider type -> (module, class); a session only ever imports the one it uses
+_PROVIDERS: dict[str, tuple[str, str]] = {
+    "openai": ("mashell.providers.openai", "OpenAIProvider"),
+    "azure": ("mashell.providers.azure", "AzureProvider"),
+    "anthropic": ("mashell.providers.anthropic", "AnthropicProvider"),
+    "ollama": ("mashell.providers.ollama", "OllamaProvider"),
+}
+_PROVIDER_MODULES = {class_name: module for module, class_name in _PROVIDERS.values()}
+
+
+def __getattr__(name: str) -> Any:
+    # Provider classes are imported on first access rather than with the package
+    module = _PROVIDER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 
 def create_provider(provider_type: str, url: str, key: str | None, model: str) -> BaseProvider:
     """Factory function to create a provider instance."""
-    providers: dict[str, type[BaseProvider]] = {
-        "openai": OpenAIProvider,
-        "azure": AzureProvider,
-        "anthropic": AnthropicProvider,
-        "ollama": OllamaProvider,
-    }
-
-    if provider_type not in providers:
-        raise ValueError(f"Unknown provider: {provider_type}. Supported: {list(providers.keys())}")
+    entry = _PROVIDERS.get(provider_type)
+    if entry is None:
+        raise ValueError(f"Unknown provider: {provider_type}. Supported: {list(_PROVIDERS)}")
 
-    provider_class = providers[provider_type]
+    module, class_name = entry
+    provider_class: type[BaseProvider] = getattr(importlib.import_module(module), class_name)
     return provider_class(url, key, model)
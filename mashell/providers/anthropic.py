@@ -1,10 +1,10 @@
 """Anthropic provider implementation."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
-import httpx
-
-from mashell.providers.base import BaseProvider, Message, Response, ToolCall
+from mashell.jsonlib import loads
+from mashell.providers.base import BaseProvider, ChatDelta, Message, Response, ToolCall
 
 
 class AnthropicProvider(BaseProvider):
@@ -18,6 +18,41 @@ class AnthropicProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
     ) -> Response:
         """Send messages to Anthropic and get response."""
+        headers, payload = self._build_request(messages)
+
+        response = await self._get_client().post(
+            f"{self.url}/v1/messages",
+            headers=headers,
+            content=self._encode_body(payload, tools),
+            timeout=120.0,
+        )
+        response.raise_for_status()
+        data = loads(response.content)
+
+        return self._parse_response(data)
+
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[ChatDelta]:
+        """Stream a response from Anthropic."""
+        headers, payload = self._build_request(messages)
+        payload["stream"] = True
+
+        async with self._get_client().stream(
+            "POST",
+            f"{self.url}/v1/messages",
+            headers=headers,
+            content=self._encode_body(payload, tools),
+            timeout=120.0,
+        ) as response:
+            response.raise_for_status()
+            async for delta in self._parse_stream(response.aiter_lines()):
+                yield delta
+
+    def _build_request(self, messages: list[Message]) -> tuple[dict[str, str], dict[str, Any]]:
+        """Build the headers and payload for a messages request."""
         headers = {
             "Content-Type": "application/json",
             "x-api-key": self.key or "",
@@ -42,20 +77,60 @@ class AnthropicProvider(BaseProvider):
         if system_content:
             payload["system"] = system_content
 
-        if tools:
-            payload["tools"] = self._convert_tools(tools)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.url}/v1/messages",
-                headers=headers,
-                json=payload,
-                timeout=120.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        return headers, payload
+
+    async def _parse_stream(self, lines: AsyncIterator[str]) -> AsyncIterator[ChatDelta]:
+        """Parse an Anthropic server-sent event stream into deltas."""
+        tool_blocks: dict[int, dict[str, Any]] = {}
+        stop_reason = "end_turn"
+        usage: dict[str, int] = {"prompt_tokens": 0, "completion_tokens": 0}
+
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            event = loads(line[5:])
+            event_type = event.get("type")
+
+            if event_type == "message_start":
+                message_usage = event.get("message", {}).get("usage", {})
+                usage["prompt_tokens"] = message_usage.get("input_tokens", 0)
+            elif event_type == "content_block_start":
+                block = event.get("content_block", {})
+                if block.get("type") == "tool_use":
+                    tool_blocks[event["index"]] = {
+                        "id": block["id"],
+                        "name": block["name"],
+                        "input_json": "",
+                    }
+            elif event_type == "content_block_delta":
+                delta = event.get("delta", {})
+                if delta.get("type") == "text_delta" and delta.get("text"):
+                    yield ChatDelta(content=delta["text"])
+                elif delta.get("type") == "input_json_delta":
+                    tool_blocks[event["index"]]["input_json"] += delta.get("partial_json", "")
+            elif event_type == "message_delta":
+                stop_reason = event.get("delta", {}).get("stop_reason") or stop_reason
+                usage["completion_tokens"] = event.get("usage", {}).get("output_tokens", 0)
+            elif event_type == "message_stop":
+                break
+            elif event_type == "error":
+                error = event.get("error", {})
+                raise RuntimeError(f"Anthropic stream error: {error.get('message', error)}")
 
-        return self._parse_response(data)
+        tool_calls: list[ToolCall] = []
+        for index in sorted(tool_blocks):
+            block = tool_blocks[index]
+            try:
+                arguments = loads(block["input_json"]) if block["input_json"] else {}
+            except ValueError:
+                arguments = {}
+            tool_calls.append(ToolCall(id=block["id"], name=block["name"], arguments=arguments))
+
+        yield ChatDelta(
+            tool_calls=tool_calls if tool_calls else None,
+            finish_reason="tool_calls" if stop_reason == "tool_use" else "stop",
+            usage=usage,
+        )
 
     def _format_message(self, msg: Message) -> dict[str, Any]:
         """Format a message for the Anthropic API."""
@@ -93,6 +168,10 @@ class AnthropicProvider(BaseProvider):
             "content": msg.content or "",
         }
 
+    def _tools_fields(self, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Get the request payload fields that declare the available tools."""
+        return {"tools": self._convert_tools(tools)}
+
     def _convert_tools(self, openai_tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Convert OpenAI tool format to Anthropic format."""
         anthropic_tools = []
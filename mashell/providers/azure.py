@@ -1,11 +1,13 @@
 """Azure OpenAI provider implementation."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
-from mashell.providers.base import BaseProvider, Message, Response
+from mashell.jsonlib import loads
+from mashell.providers.base import BaseProvider, ChatDelta, Message, Response
 
 
 class AzureProvider(BaseProvider):
@@ -18,56 +20,96 @@ class AzureProvider(BaseProvider):
     BASE_RETRY_DELAY = 2.0  # seconds
     MAX_RETRY_DELAY = 60.0  # seconds
 
+    def __init__(self, url: str, key: str | None, model: str):
+        super().__init__(url, key, model)
+        # Azure uses the deployment name as the model; endpoint and headers are fixed
+        self._endpoint = (
+            f"{self.url}/openai/deployments/{self.model}/chat/completions"
+            f"?api-version={self.API_VERSION}"
+        )
+        self._headers = {"Content-Type": "application/json", "api-key": self.key or ""}
+
     async def chat(
         self,
         messages: list[Message],
         tools: list[dict[str, Any]] | None = None,
     ) -> Response:
         """Send messages to Azure OpenAI and get response with retry logic."""
-        # Azure uses deployment name as the model
-        deployment = self.model
+        url, headers, payload = self._build_request(messages)
+        return await self._request_with_retry(url, headers, self._encode_body(payload, tools))
 
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": self.key or "",
-        }
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[ChatDelta]:
+        """Stream a response from Azure OpenAI, retrying 429s and timeouts before any output."""
+        url, headers, payload = self._build_request(messages)
+        payload["stream"] = True
+        body = self._encode_body(payload, tools)  # Encode once, reuse across retries
+
+        client = self._get_client()
+        started = False  # Once a delta is out, retrying would repeat output
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                async with client.stream(
+                    "POST", url, headers=headers, content=body, timeout=120.0
+                ) as response:
+                    if response.status_code == 429 and attempt < self.MAX_RETRIES - 1:
+                        retry_after = response.headers.get("retry-after")
+                        await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                        continue
+                    response.raise_for_status()
+
+                    async for delta in self._parse_openai_stream(response.aiter_lines()):
+                        started = True
+                        yield delta
+                    return
 
+            except httpx.TimeoutException:
+                if started or attempt >= self.MAX_RETRIES - 1:
+                    raise
+                await asyncio.sleep(self.BASE_RETRY_DELAY * (2**attempt))
+
+    def _build_request(self, messages: list[Message]) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build the URL, headers and payload for a chat completion request."""
         payload: dict[str, Any] = {
             "messages": [self._format_message(m) for m in messages],
         }
 
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = "auto"
-
-        url = (
-            f"{self.url}/openai/deployments/{deployment}/chat/completions"
-            f"?api-version={self.API_VERSION}"
-        )
+        return self._endpoint, self._headers, payload
 
-        return await self._request_with_retry(url, headers, payload)
+    def _retry_delay(self, attempt: int, retry_after: str | None) -> float:
+        """Get the backoff delay for a rate-limited attempt."""
+        delay = self.BASE_RETRY_DELAY * (2**attempt)
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        return min(delay, self.MAX_RETRY_DELAY)
 
     async def _request_with_retry(
         self,
         url: str,
         headers: dict[str, str],
-        payload: dict[str, Any],
+        body: bytes,
     ) -> Response:
         """Make request with exponential backoff retry for rate limits."""
         last_error: Exception | None = None
+        client = self._get_client()
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        url,
-                        headers=headers,
-                        json=payload,
-                        timeout=120.0,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    return self._parse_response(data)
+                response = await client.post(
+                    url,
+                    headers=headers,
+                    content=body,
+                    timeout=120.0,
+                )
+                response.raise_for_status()
+                data = loads(response.content)
+                return self._parse_response(data)
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -75,15 +117,7 @@ class AzureProvider(BaseProvider):
                 if e.response.status_code == 429:
                     # Rate limited - get retry-after header or use exponential backoff
                     retry_after = e.response.headers.get("retry-after")
-                    if retry_after:
-                        try:
-                            delay = float(retry_after)
-                        except ValueError:
-                            delay = self.BASE_RETRY_DELAY * (2**attempt)
-                    else:
-                        delay = self.BASE_RETRY_DELAY * (2**attempt)
-
-                    delay = min(delay, self.MAX_RETRY_DELAY)
+                    delay = self._retry_delay(attempt, retry_after)
 
                     if attempt < self.MAX_RETRIES - 1:
                         # Log retry attempt
@@ -108,18 +142,8 @@ class AzureProvider(BaseProvider):
 
     def _format_message(self, msg: Message) -> dict[str, Any]:
         """Format a message for the Azure OpenAI API."""
-        d: dict[str, Any] = {"role": msg.role}
-
-        if msg.content is not None:
-            d["content"] = msg.content
-
-        if msg.tool_calls:
-            d["tool_calls"] = [tc.to_dict() for tc in msg.tool_calls]
-
-        if msg.tool_call_id:
-            d["tool_call_id"] = msg.tool_call_id
-
-        return d
+        # The OpenAI wire format is Message.to_dict(), which is memoized per message
+        return msg.to_dict()
 
     def _parse_response(self, data: dict[str, Any]) -> Response:
         """Parse Azure OpenAI API response."""
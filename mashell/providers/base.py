@@ -1,11 +1,19 @@
 """Base provider interface."""
 
+import asyncio
+import hashlib
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any
 
+import httpx
 
-@dataclass
+from mashell.jsonlib import dumps, dumps_str, loads
+
+
+@dataclass(slots=True)
 class Message:
     """A message in the conversation."""
 
@@ -13,20 +21,24 @@ class Message:
     content: str | None
     tool_calls: list["ToolCall"] | None = None
     tool_call_id: str | None = None
+    # Messages are never modified once created, so their API form is built once
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for API calls."""
-        d: dict[str, Any] = {"role": self.role}
-        if self.content is not None:
-            d["content"] = self.content
-        if self.tool_calls:
-            d["tool_calls"] = [tc.to_dict() for tc in self.tool_calls]
-        if self.tool_call_id:
-            d["tool_call_id"] = self.tool_call_id
-        return d
-
-
-@dataclass
+        """Convert to dictionary for API calls. The result is shared; do not mutate it."""
+        if self._dict is None:
+            d: dict[str, Any] = {"role": self.role}
+            if self.content is not None:
+                d["content"] = self.content
+            if self.tool_calls:
+                d["tool_calls"] = [tc.to_dict() for tc in self.tool_calls]
+            if self.tool_call_id:
+                d["tool_call_id"] = self.tool_call_id
+            self._dict = d
+        return self._dict
+
+
+@dataclass(slots=True)
 class ToolCall:
     """A tool call from the LLM."""
 
@@ -36,19 +48,17 @@ class ToolCall:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        import json
-
         return {
             "id": self.id,
             "type": "function",
             "function": {
                 "name": self.name,
-                "arguments": json.dumps(self.arguments),
+                "arguments": dumps_str(self.arguments),
             },
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Response from the LLM."""
 
@@ -58,6 +68,16 @@ class Response:
     usage: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class ChatDelta:
+    """An incremental chunk of a streamed response."""
+
+    content: str | None = None  # Text generated since the previous delta
+    tool_calls: list[ToolCall] | None = None  # Fully assembled tool calls
+    finish_reason: str | None = None  # Set on the final delta
+    usage: dict[str, int] = field(default_factory=dict)
+
+
 class BaseProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -65,6 +85,12 @@ class BaseProvider(ABC):
         self.url = url.rstrip("/")
         self.key = key
         self.model = model
+        # Tool fields serialized once per schema list, as (schemas, JSON object members)
+        self._tools_json: tuple[list[dict[str, Any]], bytes] | None = None
+        # Pooled HTTP clients, one per event loop since connections are loop-bound
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
 
     @abstractmethod
     async def chat(
@@ -84,17 +110,125 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[ChatDelta]:
+        """
+        Send messages and stream the response as deltas.
+
+        Text arrives incrementally; tool calls are delivered once complete.
+        Providers without native streaming fall back to a single chat() call.
+        """
+        response = await self.chat(messages, tools)
+        if response.content:
+            yield ChatDelta(content=response.content)
+        yield ChatDelta(
+            tool_calls=response.tool_calls,
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+        )
+
+    def _tools_fields(self, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Get the request payload fields that declare the available tools."""
+        return {"tools": tools, "tool_choice": "auto"}
+
+    def _encode_body(self, payload: dict[str, Any], tools: list[dict[str, Any]] | None) -> bytes:
+        """Encode a request payload, splicing in tool fields serialized once per tool list."""
+        body = dumps(payload)
+        if not tools:
+            return body
+
+        # The registry returns the same schema list until a tool is registered
+        if self._tools_json is None or self._tools_json[0] is not tools:
+            self._tools_json = (tools, dumps(self._tools_fields(tools))[1:-1])
+        return body[:-1] + b"," + self._tools_json[1] + b"}"
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get this event loop's HTTP client, reusing its keep-alive connections."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._new_client()
+            self._clients[loop] = client
+        return client
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP client for this provider."""
+        return httpx.AsyncClient(timeout=120.0, limits=httpx.Limits(max_keepalive_connections=10))
+
+    async def aclose(self) -> None:
+        """Close the current event loop's HTTP client and its connections."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def request_key(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None,
+    ) -> str:
+        """Get a stable hash identifying a chat request."""
+        request = [self.model, [m.to_dict() for m in messages], tools]
+        return hashlib.blake2b(dumps(request, sort_keys=True), digest_size=16).hexdigest()
+
+    async def _parse_openai_stream(self, lines: AsyncIterator[str]) -> AsyncIterator[ChatDelta]:
+        """Parse an OpenAI-format server-sent event stream into deltas."""
+        partial_calls: dict[int, dict[str, Any]] = {}
+        finish_reason = "stop"
+        usage: dict[str, int] = {}
+
+        async for line in lines:
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+
+            chunk = loads(data)
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+
+            choice = choices[0]
+            delta = choice.get("delta") or {}
+            if delta.get("content"):
+                yield ChatDelta(content=delta["content"])
+
+            # Tool call arguments arrive as fragments keyed by index
+            for tc in delta.get("tool_calls") or []:
+                entry = partial_calls.setdefault(
+                    tc.get("index", 0), {"id": "", "function": {"name": "", "arguments": ""}}
+                )
+                func = tc.get("function") or {}
+                if tc.get("id"):
+                    entry["id"] = tc["id"]
+                if func.get("name"):
+                    entry["function"]["name"] = func["name"]
+                if func.get("arguments"):
+                    entry["function"]["arguments"] += func["arguments"]
+
+            if choice.get("finish_reason"):
+                finish_reason = choice["finish_reason"]
+
+        tool_calls = None
+        if partial_calls:
+            tool_calls = self._parse_tool_calls([partial_calls[i] for i in sorted(partial_calls)])
+
+        yield ChatDelta(tool_calls=tool_calls, finish_reason=finish_reason, usage=usage)
+
     def _parse_tool_calls(self, raw_tool_calls: list[dict[str, Any]]) -> list[ToolCall]:
         """Parse raw tool calls from API response."""
-        import json
-
         tool_calls = []
         for tc in raw_tool_calls:
             func = tc.get("function", {})
             args_str = func.get("arguments", "{}")
             try:
-                args = json.loads(args_str)
-            except json.JSONDecodeError:
+                args = loads(args_str)
+            except ValueError:
                 args = {}
 
             tool_calls.append(
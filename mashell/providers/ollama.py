@@ -1,10 +1,12 @@
 """Ollama provider implementation."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
 
-from mashell.providers.base import BaseProvider, Message, Response, ToolCall
+from mashell.jsonlib import loads
+from mashell.providers.base import BaseProvider, ChatDelta, Message, Response, ToolCall
 
 
 class OllamaProvider(BaseProvider):
@@ -16,29 +18,86 @@ class OllamaProvider(BaseProvider):
         tools: list[dict[str, Any]] | None = None,
     ) -> Response:
         """Send messages to Ollama and get response."""
-        payload: dict[str, Any] = {
-            "model": self.model,
-            "messages": [self._format_message(m) for m in messages],
-            "stream": False,
-        }
+        payload = self._build_payload(messages, stream=False)
+
+        response = await self._get_client().post(
+            f"{self.url}/api/chat",
+            headers={"Content-Type": "application/json"},
+            content=self._encode_body(payload, tools),
+            timeout=300.0,  # Longer timeout for local models
+        )
+        response.raise_for_status()
+        data = loads(response.content)
 
-        if tools:
-            payload["tools"] = tools
+        return self._parse_response(data)
 
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[ChatDelta]:
+        """Stream a response from Ollama (newline-delimited JSON)."""
+        payload = self._build_payload(messages, stream=True)
+        tool_calls: list[ToolCall] = []
+        usage: dict[str, int] = {}
+
+        async with self._get_client().stream(
+            "POST",
+            f"{self.url}/api/chat",
+            headers={"Content-Type": "application/json"},
+            content=self._encode_body(payload, tools),
+            timeout=300.0,  # Longer timeout for local models
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = loads(line)
+                message = chunk.get("message", {})
+                if message.get("content"):
+                    yield ChatDelta(content=message["content"])
+                if message.get("tool_calls"):
+                    tool_calls.extend(self._parse_ollama_tool_calls(message["tool_calls"]))
+                if chunk.get("done"):
+                    usage = {
+                        "prompt_tokens": chunk.get("prompt_eval_count", 0),
+                        "completion_tokens": chunk.get("eval_count", 0),
+                    }
+                    break
+
+        # Ollama does not assign tool call IDs; number them across the whole stream
+        for i, tc in enumerate(tool_calls):
+            tc.id = f"call_{i}"
+
+        yield ChatDelta(
+            tool_calls=tool_calls if tool_calls else None,
+            finish_reason="tool_calls" if tool_calls else "stop",
+            usage=usage,
+        )
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP client that bypasses proxies."""
         # 本地 Ollama 不走代理
-        async with httpx.AsyncClient(
+        return httpx.AsyncClient(
             proxy=None,
             transport=httpx.AsyncHTTPTransport(proxy=None),
-        ) as client:
-            response = await client.post(
-                f"{self.url}/api/chat",
-                json=payload,
-                timeout=300.0,  # Longer timeout for local models
-            )
-            response.raise_for_status()
-            data = response.json()
+            timeout=300.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
 
-        return self._parse_response(data)
+    def _build_payload(self, messages: list[Message], stream: bool) -> dict[str, Any]:
+        """Build the payload for a chat request."""
+        payload: dict[str, Any] = {
+            "model": self.model,
+            "messages": [self._format_message(m) for m in messages],
+            "stream": stream,
+        }
+
+        return payload
+
+    def _tools_fields(self, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Get the request payload fields that declare the available tools."""
+        return {"tools": tools}
 
     def _format_message(self, msg: Message) -> dict[str, Any]:
         """Format a message for the Ollama API."""
@@ -1,13 +1,14 @@
 """Session persistence and management."""
 
-import json
 import os
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from mashell.agent.context import ContextManager, TaskMemory
+from mashell.jsonlib import dumps, loads
 from mashell.providers.base import Message, ToolCall
 
 
@@ -136,8 +137,8 @@ class SessionManager:
         path = self._session_path(self._current_session.name)
         self._current_session.updated = self._now_iso()
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self._current_session), f, indent=2, ensure_ascii=False)
+        # Saved after every turn, so encode straight to bytes (orjson when installed)
+        path.write_bytes(dumps(asdict(self._current_session), indent=True))
 
     def load(self, name: str) -> SessionData | None:
         """Load a session by name."""
@@ -145,10 +146,12 @@ class SessionManager:
         if not path.exists():
             return None
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        session = SessionData(**loads(path.read_bytes()))
+        self._current_session = session
+        return session
 
-        session = SessionData(**data)
+    def activate(self, session: SessionData) -> SessionData:
+        """Make an already-loaded session (e.g. from list_sessions) current."""
         self._current_session = session
         return session
 
@@ -158,9 +161,8 @@ class SessionManager:
         if not sessions:
             return None
 
-        # Sort by updated time, most recent first
-        sessions.sort(key=lambda s: s.updated, reverse=True)
-        return self.load(sessions[0].name)
+        # list_sessions() already read every file in full; no need to load again
+        return self.activate(max(sessions, key=lambda s: s.updated))
 
     def list_sessions(self) -> list[SessionData]:
         """List all saved sessions."""
@@ -168,15 +170,28 @@ class SessionManager:
 
         for path in self.sessions_dir.glob("*.json"):
             try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                sessions.append(SessionData(**data))
-            except (json.JSONDecodeError, TypeError, KeyError):
+                sessions.append(SessionData(**loads(path.read_bytes())))
+            except (ValueError, TypeError, KeyError):
                 # Skip invalid session files
                 continue
 
         return sessions
 
+    def iter_recent(self) -> Iterator[SessionData]:
+        """Lazily yield saved sessions, most recently written file first."""
+        paths = []
+        for path in self.sessions_dir.glob("*.json"):
+            try:
+                paths.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+
+        for _, path in sorted(paths, reverse=True):
+            try:
+                yield SessionData(**loads(path.read_bytes()))
+            except (OSError, ValueError, TypeError, KeyError):
+                continue
+
     def delete(self, name: str) -> bool:
         """Delete a session by name."""
         path = self._session_path(name)
@@ -207,6 +207,7 @@ class CheckBackgroundTool(BaseTool):
     }
 
     requires_permission = False  # Reading output doesn't need permission
+    concurrency_safe = True
 
     def __init__(self, manager: BackgroundTaskManager) -> None:
         self.manager = manager
@@ -1,6 +1,7 @@
 """Base tool interface and registry."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,10 +23,17 @@ class BaseTool(ABC):
     parameters: dict[str, Any]  # JSON Schema
     requires_permission: bool = True
     permission_level: str = "always_ask"  # "auto", "always_ask"
+    concurrency_safe: bool = False  # Read-only, may run alongside other safe tools
+    cache_approval: bool = True  # Identical calls may reuse a recent approval
 
     @abstractmethod
-    async def execute(self, **kwargs: Any) -> ToolResult:
-        """Execute the tool with given arguments."""
+    def execute(self, **kwargs: Any) -> ToolResult | Awaitable[ToolResult]:
+        """
+        Execute the tool with given arguments.
+
+        May be declared ``async def`` for tools that await I/O, or plain ``def``
+        for blocking work; the agent runs plain functions in a worker thread.
+        """
         pass
 
     def to_schema(self) -> dict[str, Any]:
@@ -45,10 +53,12 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, BaseTool] = {}
+        self._schemas: list[dict[str, Any]] | None = None
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._schemas = None  # Invalidate cached schemas
 
     def get(self, name: str) -> BaseTool | None:
         """Get a tool by name."""
@@ -59,5 +69,7 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def all_schemas(self) -> list[dict[str, Any]]:
-        """Get all tool schemas for LLM."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get all tool schemas for LLM (cached until the next register)."""
+        if self._schemas is None:
+            self._schemas = [tool.to_schema() for tool in self._tools.values()]
+        return self._schemas
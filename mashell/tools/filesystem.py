@@ -81,6 +81,7 @@ Handles binary files, large files, and encoding issues gracefully.
 
     requires_permission = False  # Reading is safe
     permission_level = "auto"
+    concurrency_safe = True
 
     def _read_pdf(self, file_path: Path) -> str | None:
         """Try to read PDF file content."""
@@ -112,7 +113,7 @@ Handles binary files, large files, and encoding issues gracefully.
         except Exception:
             return None
 
-    async def execute(
+    def execute(
         self,
         path: str,
         start_line: int | None = None,
@@ -253,6 +254,7 @@ Returns a structured view of files and subdirectories with:
 
     requires_permission = False
     permission_level = "auto"
+    concurrency_safe = True
 
     def _format_size(self, size: int) -> str:
         """Format file size in human-readable form."""
@@ -315,7 +317,7 @@ Returns a structured view of files and subdirectories with:
 
         return entries
 
-    async def execute(
+    def execute(
         self,
         path: str = ".",
         pattern: str | None = None,
@@ -408,6 +410,7 @@ Returns matching lines with file paths and line numbers.
 
     requires_permission = False
     permission_level = "auto"
+    concurrency_safe = True
 
     def _search_file(
         self,
@@ -442,7 +445,7 @@ Returns matching lines with file paths and line numbers.
         except (PermissionError, OSError, UnicodeDecodeError):
             return 0
 
-    async def execute(
+    def execute(
         self,
         pattern: str,
         path: str = ".",
@@ -539,8 +542,9 @@ Creates parent directories as needed.
 
     requires_permission = True  # Writing requires confirmation
     permission_level = "always_ask"
+    cache_approval = False  # File may have changed since the last approval
 
-    async def execute(
+    def execute(
         self,
         path: str,
         content: str,
@@ -640,8 +644,9 @@ edit_docx("resume.docx", [
 
     requires_permission = True
     permission_level = "always_ask"
+    cache_approval = False  # Document may have changed since the last approval
 
-    async def execute(
+    def execute(
         self,
         path: str,
         operations: list[dict[str, str]],
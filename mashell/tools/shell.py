@@ -5,6 +5,60 @@ from typing import Any
 
 from mashell.tools.base import BaseTool, ToolResult
 
+# Output limits and the markers left where output was cut
+_MAX_OUTPUT_LINES = 200
+_MAX_OUTPUT_CHARS = 10000
+_TRUNCATED_CHARS = "\n\n[Output truncated: {} chars total]"
+_OMITTED_LINES = "\n\n[... {} lines omitted ...]\n\n"
+# Bytes kept from each end of a stream; anything between is dropped while reading
+_READ_KEEP_BYTES = _MAX_OUTPUT_CHARS * 4
+_READ_CHUNK_BYTES = 65536
+_OMITTED_BYTES = b"\n\n[... %d bytes omitted ...]\n\n"
+
+
+def _nth_newline(text: str, n: int, from_end: bool = False) -> int:
+    """Get the index of the nth newline from the start or end of text, or -1."""
+    pos = len(text) if from_end else -1
+    for _ in range(n):
+        pos = text.rfind("\n", 0, pos) if from_end else text.find("\n", pos + 1)
+        if pos == -1:
+            break
+    return pos
+
+
+async def _read_bounded(
+    stream: asyncio.StreamReader | None, keep: int = _READ_KEEP_BYTES
+) -> tuple[bytes, int]:
+    """
+    Read a stream to EOF, keeping only its first and last keep bytes in memory.
+
+    Returns the kept bytes and how many more lines the stream had than they do.
+    """
+    if stream is None:
+        return b"", 0
+
+    head = bytearray()
+    tail = bytearray()
+    dropped = 0
+    dropped_lines = 0
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        if len(head) < keep:
+            room = keep - len(head)
+            head += chunk[:room]
+            chunk = chunk[room:]
+        tail += chunk
+        if len(tail) > keep:
+            excess = len(tail) - keep
+            dropped += excess
+            dropped_lines += tail.count(b"\n", 0, excess)
+            del tail[:excess]
+
+    if not dropped:
+        return bytes(head + tail), 0
+    # The marker's own newlines are not lines of output
+    hidden_lines = dropped_lines - _OMITTED_BYTES.count(b"\n")
+    return bytes(head) + _OMITTED_BYTES % dropped + bytes(tail), hidden_lines
+
 
 class ShellTool(BaseTool):
     """Shell tool for executing commands (not for file reading)."""
@@ -73,8 +127,13 @@ class ShellTool(BaseTool):
                 cwd=working_dir,
             )
 
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            # Drain both pipes concurrently so memory stays bounded for huge outputs
+            (stdout, stdout_hidden), (stderr, stderr_hidden), _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_bounded(process.stdout),
+                    _read_bounded(process.stderr),
+                    process.wait(),
+                ),
                 timeout=timeout,
             )
 
@@ -87,7 +146,9 @@ class ShellTool(BaseTool):
                 full_output += f"\n[stderr]:\n{err}"
 
             # Truncate very long output
-            full_output = self._truncate_output(full_output)
+            full_output = self._truncate_output(
+                full_output, hidden_lines=stdout_hidden + stderr_hidden
+            )
 
             return ToolResult(
                 success=process.returncode == 0,
@@ -112,23 +173,26 @@ class ShellTool(BaseTool):
                 error=str(e),
             )
 
-    def _truncate_output(self, output: str, max_lines: int = 200, max_chars: int = 10000) -> str:
-        """Truncate long output while preserving useful information."""
-        if len(output) <= max_chars:
-            lines = output.split("\n")
-            if len(lines) <= max_lines:
-                return output
-
-        lines = output.split("\n")
-        total_lines = len(lines)
-
+    def _truncate_output(
+        self,
+        output: str,
+        max_lines: int = _MAX_OUTPUT_LINES,
+        max_chars: int = _MAX_OUTPUT_CHARS,
+        hidden_lines: int = 0,
+    ) -> str:
+        """Truncate long output, counting hidden_lines already dropped while reading."""
+        # Counting newlines needs no list, so short outputs return after one pass
+        total_lines = output.count("\n") + 1
         if total_lines <= max_lines:
+            if len(output) <= max_chars:
+                return output
             # Just char limit exceeded
-            return output[:max_chars] + f"\n\n[Output truncated: {len(output)} chars total]"
+            return output[:max_chars] + _TRUNCATED_CHARS.format(len(output))
 
-        # Keep first and last portions
+        # Keep first and last portions, sliced at newline offsets without splitting
         keep_lines = max_lines // 2
-        first_part = "\n".join(lines[:keep_lines])
-        last_part = "\n".join(lines[-keep_lines:])
+        first_part = output[: _nth_newline(output, keep_lines)]
+        last_part = output[_nth_newline(output, keep_lines, from_end=True) + 1 :]
 
-        return f"{first_part}\n\n[... {total_lines - max_lines} lines omitted ...]\n\n{last_part}"
+        omitted = total_lines - max_lines + hidden_lines
+        return first_part + _OMITTED_LINES.format(omitted) + last_part
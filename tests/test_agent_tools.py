@@ -0,0 +1,97 @@
+"""Tests for how the agent batches and runs tool calls."""
+
+import asyncio
+import io
+
+import pytest
+from rich.console import Console
+
+from mashell.agent.core import Agent
+from mashell.config import Config, PermissionConfig, ProviderConfig
+from mashell.providers.base import ToolCall
+from mashell.tools.base import BaseTool, ToolResult
+
+
+class _ReadTool(BaseTool):
+    """A concurrency-safe tool that records how many copies run at once."""
+
+    name = "read"
+    description = "Read"
+    parameters: dict = {}
+    requires_permission = False
+    concurrency_safe = True
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def execute(self, value="", fail=False):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if fail:
+            raise RuntimeError("boom")
+        return ToolResult(success=True, output=value)
+
+
+class _WriteTool(BaseTool):
+    name = "write"
+    description = "Write"
+    parameters: dict = {}
+
+    def execute(self):
+        return ToolResult(success=True, output="written")
+
+
+@pytest.fixture
+def agent(tmp_path):
+    config = Config(
+        provider=ProviderConfig(provider="openai", url="http://llm.test", key=None, model="m"),
+        permissions=PermissionConfig(),
+        working_dir=str(tmp_path),
+    )
+    agent = Agent(config, Console(file=io.StringIO()))
+    agent.tools.register(_ReadTool())
+    agent.tools.register(_WriteTool())
+    return agent
+
+
+def _call(name, **arguments):
+    return ToolCall(id=f"{name}-{len(arguments)}", name=name, arguments=arguments)
+
+
+def test_next_tool_batch_groups_consecutive_safe_calls(agent):
+    calls = [_call("read"), _call("read"), _call("write"), _call("read"), _call("missing")]
+
+    batches = []
+    start = 0
+    while start < len(calls):
+        batch = agent._next_tool_batch(calls, start)
+        batches.append([tc.name for tc in batch])
+        start += len(batch)
+
+    assert batches == [["read", "read"], ["write"], ["read"], ["missing"]]
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_batch_runs_calls_together_in_order(agent):
+    calls = [_call("read", value="a"), _call("read", value="b"), _call("read", value="c")]
+
+    results = await agent._execute_tool_batch(calls)
+
+    assert [r.output for r in results] == ["a", "b", "c"]
+    assert agent.tools.get("read").max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_batch_reports_failures_per_call(agent):
+    calls = [_call("read", fail=True), _call("missing"), _call("read", value="ok")]
+
+    results = await agent._execute_tool_batch(calls)
+
+    assert [(r.success, r.error) for r in results] == [
+        (False, "boom"),
+        (False, "Unknown tool: missing"),
+        (True, None),
+    ]
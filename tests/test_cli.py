@@ -0,0 +1,50 @@
+"""Tests for the command line entry point."""
+
+import io
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from mashell.cli import _ask, _confirm, parse_args
+
+
+def test_version_matches_package_metadata(capsys, monkeypatch):
+    pyproject = tomllib.loads((Path(__file__).parents[1] / "pyproject.toml").read_text())
+    monkeypatch.setattr("sys.argv", ["mashell", "--version"])
+
+    with pytest.raises(SystemExit):
+        parse_args()
+
+    assert capsys.readouterr().out.split()[-1] == pyproject["project"]["version"]
+
+
+def _pipe(monkeypatch, text):
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+
+
+def test_piped_ask_shows_choices_and_retries_invalid_input(capsys, monkeypatch):
+    _pipe(monkeypatch, "5\n2\n")
+
+    assert _ask("Provider", choices=["1", "2"], default="1") == "2"
+    out = capsys.readouterr().out
+    assert "Provider [1/2] (1): " in out
+    assert out.count("Please select one of the available options") == 1
+
+
+def test_piped_ask_uses_default_at_eof(monkeypatch):
+    _pipe(monkeypatch, "")
+
+    assert _ask("Model name", default="m") == "m"
+    with pytest.raises(SystemExit, match="No answer for: API URL"):
+        _ask("API URL")
+
+
+def test_piped_confirm_retries_unrecognized_answers(capsys, monkeypatch):
+    _pipe(monkeypatch, "maybe\nno\n")
+
+    assert _confirm("Test now?") is False
+    assert capsys.readouterr().out.count("Please enter Y or N") == 1
+
+    _pipe(monkeypatch, "")
+    assert _confirm("Test now?", default=True) is True
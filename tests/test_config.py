@@ -0,0 +1,115 @@
+"""Tests for config file reading and writing."""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from mashell import config
+from mashell.config import add_auto_approve_tool, read_config_file, write_config_file
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_yaml_cache():
+    # Every read after the first would otherwise come from the in-process cache
+    config._YAML_CACHE.clear()
+    yield
+    config._YAML_CACHE.clear()
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@posix_only
+def test_write_keeps_existing_file_mode(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("profiles: {}\n")
+    os.chmod(path, 0o600)
+
+    add_auto_approve_tool("read_file", str(path))
+
+    assert read_config_file(path)["permissions"]["auto_approve"] == ["read_file"]
+    assert _mode(path) == 0o600
+
+
+def test_write_skips_unchanged_content(tmp_path):
+    path = tmp_path / "config.yaml"
+    write_config_file(path, {"a": 1})
+    before = path.stat().st_mtime_ns
+
+    write_config_file(path, {"a": 1})
+
+    assert path.stat().st_mtime_ns == before
+    assert not (tmp_path / "config.yaml.tmp").exists()
+
+
+def test_sidecar_skipped_for_non_json_yaml(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("profiles:\n  1:\n    model: m\ncreated: 2024-01-02\n")
+
+    for _ in range(2):  # The second read would come from a sidecar, if one existed
+        config._YAML_CACHE.clear()
+        data = read_config_file(path)
+        assert list(data["profiles"]) == [1]
+        assert data["created"].isoformat() == "2024-01-02"
+    assert not (tmp_path / ".config.yaml.json").exists()
+
+
+def test_sidecar_reused_until_yaml_changes(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("profiles:\n  p:\n    model: m\n")
+    sidecar = tmp_path / ".config.yaml.json"
+
+    assert read_config_file(path) == {"profiles": {"p": {"model": "m"}}}
+    assert sidecar.exists()
+    if sys.platform != "win32":
+        assert _mode(sidecar) == 0o600
+
+    config._YAML_CACHE.clear()
+    assert read_config_file(path) == {"profiles": {"p": {"model": "m"}}}
+
+    path.write_text("profiles:\n  q:\n    model: other\n")
+    assert read_config_file(path) == {"profiles": {"q": {"model": "other"}}}
+
+
+def test_read_returns_private_copy(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("permissions:\n  auto_approve: []\n")
+
+    read_config_file(path)["permissions"]["auto_approve"].append("shell")
+
+    assert read_config_file(path)["permissions"]["auto_approve"] == []
+
+
+def _profile_config(tmp_path, profile):
+    path = tmp_path / "config.yaml"
+    write_config_file(path, {"profiles": {"p": profile}})
+    return config.load_from_profile("p", str(path))
+
+
+def test_profile_fields_expand_env_vars(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_HOST", "http://llm.test")
+    monkeypatch.setenv("LLM_MODEL", "m")
+    monkeypatch.setenv("LLM_KEY", "secret")
+
+    loaded = _profile_config(
+        tmp_path,
+        {"provider": "openai", "url": "${LLM_HOST}", "key": "${LLM_KEY}", "model": "${LLM_MODEL}"},
+    )
+
+    assert (loaded.provider.url, loaded.provider.model, loaded.provider.key) == (
+        "http://llm.test",
+        "m",
+        "secret",
+    )
+
+
+def test_unset_env_var_in_required_field_is_reported(tmp_path, monkeypatch):
+    monkeypatch.delenv("LLM_HOST", raising=False)
+
+    with pytest.raises(ValueError, match="URL is required. Set LLM_HOST"):
+        _profile_config(tmp_path, {"provider": "openai", "url": "${LLM_HOST}", "model": "m"})
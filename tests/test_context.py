@@ -0,0 +1,48 @@
+"""Tests for fitting conversation context into a token budget."""
+
+from mashell.agent.context import ContextManager
+from mashell.providers.base import Message, ToolCall
+
+BIG = "x" * 400  # About 100 tokens
+
+
+def _conversation():
+    call = ToolCall(id="c1", name="shell", arguments={"command": "ls"})
+    return [
+        Message("system", "prompt"),
+        Message("user", BIG),
+        Message("assistant", BIG, tool_calls=[call]),
+        Message("tool", BIG, tool_call_id="c1"),
+        Message("assistant", BIG),
+        Message("user", "latest question"),
+        Message("assistant", "answer"),
+    ]
+
+
+def test_messages_within_budget_are_returned_unchanged():
+    messages = _conversation()
+
+    assert ContextManager().trim_to_budget(messages, max_tokens=10_000) is messages
+
+
+def test_trim_drops_oldest_messages_behind_a_note():
+    messages = _conversation()
+
+    trimmed = ContextManager().trim_to_budget(messages, max_tokens=150, keep_recent=2)
+
+    # The tool call and its result are dropped together, never separately
+    assert trimmed[0] is messages[0]
+    assert trimmed[1] == Message("user", "[Summary of 3 prior messages omitted]")
+    assert trimmed[2:] == messages[4:]
+
+
+def test_trim_keeps_the_last_user_message():
+    messages = _conversation()
+
+    trimmed = ContextManager().trim_to_budget(messages, max_tokens=1, keep_recent=0)
+
+    assert trimmed == [
+        messages[0],
+        Message("user", "[Summary of 5 prior messages omitted]"),
+        messages[5],
+    ]
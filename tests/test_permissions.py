@@ -0,0 +1,81 @@
+"""Tests for reusing recent tool approvals."""
+
+import pytest
+
+from mashell.config import PermissionConfig
+from mashell.permissions.manager import PermissionManager, PermissionRequest, PermissionResult
+
+
+class _CountingUI:
+    """Approves every prompt and counts how often the user was asked."""
+
+    def __init__(self):
+        self.prompts = 0
+
+    async def prompt(self, request):
+        self.prompts += 1
+        return PermissionResult(approved=True)
+
+
+def _manager(ttl=60.0):
+    manager = PermissionManager(PermissionConfig(), approval_ttl=ttl)
+    manager.ui = _CountingUI()
+    return manager
+
+
+async def _ask_twice(manager, command, cacheable=True):
+    request = PermissionRequest("shell", {"command": command}, "run", cacheable=cacheable)
+    await manager.check(request)
+    await manager.check(request)
+    return manager.ui.prompts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command", ["ls -la", "git status && cat a.txt | grep x", "git log -3"])
+async def test_read_only_command_approval_is_reused(command):
+    assert await _ask_twice(_manager(), command) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command",
+    [
+        "rm -rf build",
+        "mv a b",
+        "chmod 777 a",
+        "chown root a",
+        "git push --force",
+        "git reset --hard",
+        "echo x > a.txt",
+        "cat a | tee b",
+        "ls; sudo reboot",
+        "echo $(rm a)",
+        "git diff --output=a",
+    ],
+)
+async def test_mutating_command_approval_is_not_reused(command):
+    assert await _ask_twice(_manager(), command) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_tool_approval_is_not_reused():
+    assert await _ask_twice(_manager(), "ls", cacheable=False) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_and_revoked_approvals_prompt_again():
+    assert await _ask_twice(_manager(ttl=-1), "ls") == 2
+
+    manager = _manager()
+    request = PermissionRequest("shell", {"command": "ls"}, "run")
+    await manager.check(request)
+    assert manager.revoke_approvals() == 1
+    await manager.check(request)
+    assert manager.ui.prompts == 2
+
+
+def test_file_edit_tools_never_reuse_approval():
+    from mashell.tools.filesystem import EditDocxTool, WriteFileTool
+
+    assert not WriteFileTool.cache_approval
+    assert not EditDocxTool.cache_approval
@@ -0,0 +1,169 @@
+"""Tests for provider streaming and request handling."""
+
+import json
+
+import httpx
+import pytest
+
+from mashell.providers import create_provider
+from mashell.providers.base import Message
+
+
+def _mock_provider(provider_type, handler):
+    """Create a provider whose HTTP client is served by handler."""
+    provider = create_provider(provider_type, "http://llm.test", "key", "model")
+    provider._new_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider.BASE_RETRY_DELAY = 0
+    return provider
+
+
+def _sse(*events):
+    return "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+
+
+async def _collect(provider, tools=None):
+    return [d async for d in provider.chat_stream([Message("user", "hi")], tools=tools)]
+
+
+OPENAI_STREAM = _sse(
+    {"choices": [{"delta": {"content": "Hel"}}]},
+    {"choices": [{"delta": {"content": "lo"}}]},
+    {
+        "choices": [
+            {
+                "delta": {
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": "c1",
+                            "function": {"name": "shell", "arguments": '{"com'},
+                        }
+                    ]
+                }
+            }
+        ]
+    },
+    {
+        "choices": [
+            {"delta": {"tool_calls": [{"index": 0, "function": {"arguments": 'mand": "ls"}'}}]}}
+        ]
+    },
+    {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+    {"choices": [], "usage": {"prompt_tokens": 3, "completion_tokens": 2}},
+)
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_assembles_text_tool_calls_and_usage():
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, text=OPENAI_STREAM)
+
+    deltas = await _collect(_mock_provider("openai", handler))
+
+    assert "".join(d.content or "" for d in deltas) == "Hello"
+    final = deltas[-1]
+    assert final.finish_reason == "tool_calls"
+    assert [(tc.id, tc.name, tc.arguments) for tc in final.tool_calls] == [
+        ("c1", "shell", {"command": "ls"})
+    ]
+    assert final.usage == {"prompt_tokens": 3, "completion_tokens": 2}
+    assert requests[0]["stream_options"] == {"include_usage": True}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider_type", ["openai", "azure"])
+async def test_stream_retries_timeout_before_output(provider_type):
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200, text=_sse({"choices": [{"delta": {"content": "ok"}}]}))
+
+    deltas = await _collect(_mock_provider(provider_type, handler))
+
+    assert calls == 2
+    assert deltas[0].content == "ok"
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_rate_limit():
+    statuses = iter([429, 200])
+
+    def handler(request):
+        status = next(statuses)
+        text = _sse({"choices": [{"delta": {"content": "ok"}}]}) if status == 200 else ""
+        return httpx.Response(status, text=text, headers={"retry-after": "0"})
+
+    deltas = await _collect(_mock_provider("openai", handler))
+
+    assert deltas[0].content == "ok"
+
+
+@pytest.mark.asyncio
+async def test_anthropic_stream():
+    stream = "".join(
+        f"event: x\ndata: {json.dumps(e)}\n\n"
+        for e in [
+            {"type": "message_start", "message": {"usage": {"input_tokens": 5}}},
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": "Hi"},
+            },
+            {
+                "type": "content_block_start",
+                "index": 1,
+                "content_block": {"type": "tool_use", "id": "t1", "name": "read_file"},
+            },
+            {
+                "type": "content_block_delta",
+                "index": 1,
+                "delta": {"type": "input_json_delta", "partial_json": '{"path": "a"}'},
+            },
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "tool_use"},
+                "usage": {"output_tokens": 4},
+            },
+            {"type": "message_stop"},
+        ]
+    )
+
+    deltas = await _collect(_mock_provider("anthropic", lambda r: httpx.Response(200, text=stream)))
+
+    assert deltas[0].content == "Hi"
+    final = deltas[-1]
+    assert final.finish_reason == "tool_calls"
+    assert [(tc.id, tc.arguments) for tc in final.tool_calls] == [("t1", {"path": "a"})]
+    assert final.usage == {"prompt_tokens": 5, "completion_tokens": 4}
+
+
+@pytest.mark.asyncio
+async def test_ollama_ndjson_stream():
+    lines = [
+        {"message": {"content": "A"}},
+        {"message": {"tool_calls": [{"function": {"name": "list_dir", "arguments": {}}}]}},
+        {
+            "message": {
+                "tool_calls": [{"function": {"name": "shell", "arguments": {"command": "ls"}}}]
+            }
+        },
+        {"done": True, "prompt_eval_count": 7, "eval_count": 1},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n"
+
+    deltas = await _collect(_mock_provider("ollama", lambda r: httpx.Response(200, text=body)))
+
+    assert deltas[0].content == "A"
+    final = deltas[-1]
+    assert [(tc.id, tc.name) for tc in final.tool_calls] == [
+        ("call_0", "list_dir"),
+        ("call_1", "shell"),
+    ]
+    assert final.usage == {"prompt_tokens": 7, "completion_tokens": 1}
@@ -0,0 +1,66 @@
+"""Tests for the LLM response cache and its request keys."""
+
+from rich.console import Console
+
+from mashell.agent.cache import ResponseCache
+from mashell.agent.core import Agent
+from mashell.agent.prompt import get_system_prompt_template
+from mashell.config import Config, PermissionConfig, ProviderConfig
+from mashell.providers.base import Message, Response, ToolCall
+
+
+def _config(tmp_path, response_cache=True):
+    return Config(
+        provider=ProviderConfig(provider="openai", url="http://llm.test", key=None, model="m"),
+        permissions=PermissionConfig(),
+        working_dir=str(tmp_path),
+        response_cache=response_cache,
+    )
+
+
+def test_put_and_get(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db")
+    cache.put("k", Response(content="hello", tool_calls=None, finish_reason="stop"))
+
+    hit = cache.get("k")
+
+    assert hit is not None and hit.content == "hello"
+    assert cache.get("other") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.clear() == 1
+    assert cache.count() == 0
+
+
+def test_tool_calls_and_empty_replies_are_not_cached(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db")
+    tool_call = ToolCall(id="1", name="shell", arguments={"command": "ls"})
+    cache.put("tools", Response(content="x", tool_calls=[tool_call], finish_reason="tool_calls"))
+    cache.put("empty", Response(content=None, tool_calls=None, finish_reason="stop"))
+
+    assert cache.get("tools") is None
+    assert cache.get("empty") is None
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db", ttl=-1)
+    cache.put("k", Response(content="hello", tool_calls=None, finish_reason="stop"))
+
+    assert cache.get("k") is None
+
+
+def test_cache_is_off_by_default(tmp_path):
+    agent = Agent(_config(tmp_path, response_cache=False), Console())
+
+    assert agent.response_cache is None
+
+
+def test_cache_key_ignores_prompt_time(tmp_path):
+    agent = Agent(_config(tmp_path), Console())
+    template = get_system_prompt_template(str(tmp_path))
+
+    def key(time, question):
+        system = Message(role="system", content=template.replace("$current_time", time))
+        return agent._cache_key([system, Message(role="user", content=question)], [])
+
+    assert key("2024-01-01 10:00", "hi") == key("2024-01-02 18:30", "hi")
+    assert key("2024-01-01 10:00", "hi") != key("2024-01-01 10:00", "bye")
@@ -0,0 +1,15 @@
+"""Tests for session persistence."""
+
+import os
+
+from mashell.session import SessionManager
+
+
+def test_iter_recent_yields_newest_written_first(tmp_path):
+    manager = SessionManager(tmp_path)
+    for i, name in enumerate(["old", "newest", "middle"]):
+        manager.create(name=name)
+        os.utime(tmp_path / f"{name}.json", ns=(0, [1, 3, 2][i] * 10**9))
+    (tmp_path / "broken.json").write_text("{not json")
+
+    assert [s.name for s in manager.iter_recent()] == ["newest", "middle", "old"]
@@ -0,0 +1,73 @@
+"""Tests for shell output reading and truncation."""
+
+import asyncio
+
+import pytest
+
+from mashell.tools.shell import ShellTool, _nth_newline, _read_bounded
+
+
+def _stream(data):
+    stream = asyncio.StreamReader()
+    stream.feed_data(data)
+    stream.feed_eof()
+    return stream
+
+
+def test_nth_newline():
+    text = "a\nb\nc\nd"
+
+    assert _nth_newline(text, 2) == 3
+    assert _nth_newline(text, 2, from_end=True) == 3
+    assert _nth_newline(text, 1, from_end=True) == 5
+    assert _nth_newline(text, 5) == -1
+
+
+@pytest.mark.asyncio
+async def test_read_bounded_keeps_short_streams_whole():
+    assert await _read_bounded(_stream(b"line 1\nline 2\n"), keep=100) == (
+        b"line 1\nline 2\n",
+        0,
+    )
+    assert await _read_bounded(None) == (b"", 0)
+
+
+@pytest.mark.asyncio
+async def test_read_bounded_drops_the_middle():
+    data = b"".join(b"%04d\n" % i for i in range(1000))
+
+    kept, hidden_lines = await _read_bounded(_stream(data), keep=50)
+
+    assert kept.startswith(data[:50]) and kept.endswith(data[-50:])
+    assert b"[... %d bytes omitted ...]" % (len(data) - 100) in kept
+    assert kept.count(b"\n") + hidden_lines == data.count(b"\n")
+
+
+def test_truncate_output_leaves_short_output_alone():
+    assert ShellTool()._truncate_output("a\nb") == "a\nb"
+
+
+def test_truncate_output_by_chars():
+    output = ShellTool()._truncate_output("x" * 50, max_chars=10)
+
+    assert output == "x" * 10 + "\n\n[Output truncated: 50 chars total]"
+
+
+def test_truncate_output_keeps_first_and_last_lines():
+    output = ShellTool()._truncate_output("\n".join(map(str, range(100))), max_lines=10)
+    lines = output.split("\n")
+
+    assert lines[:5] == ["0", "1", "2", "3", "4"]
+    assert lines[-5:] == ["95", "96", "97", "98", "99"]
+    assert "[... 90 lines omitted ...]" in output
+
+
+@pytest.mark.asyncio
+async def test_omitted_lines_include_lines_dropped_while_reading():
+    data = "".join(f"{i:04d}\n" for i in range(1000)).rstrip("\n")
+    kept, hidden_lines = await _read_bounded(_stream(data.encode()), keep=500)
+
+    output = ShellTool()._truncate_output(kept.decode(), max_lines=10, hidden_lines=hidden_lines)
+
+    assert output.startswith("0000\n0001") and output.endswith("0998\n0999")
+    assert "[... 990 lines omitted ...]" in output